@@ -0,0 +1,46 @@
+"""
+Create the database schema.
+
+Run once per deployment (or after adding tables/indexes) instead of
+creating tables on every app start:
+
+    python -m app.bootstrap
+"""
+from sqlalchemy import inspect, text
+
+from . import models  # noqa: F401  (registers tables on Base.metadata)
+from .database import Base, engine
+
+
+def create_schema(bind=engine):
+    """
+    Create missing tables, then add nullable columns and indexes that are
+    missing on existing tables
+    """
+    Base.metadata.create_all(bind=bind)
+
+    inspector = inspect(bind)
+    quote = bind.dialect.identifier_preparer.quote
+    for table in Base.metadata.sorted_tables:
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in columns or not column.nullable:
+                continue
+            definition = f"{quote(column.name)} {column.type.compile(dialect=bind.dialect)}"
+            # Keep foreign keys that create_all() would have emitted
+            for fk in column.foreign_keys:
+                definition += f" REFERENCES {quote(fk.column.table.name)} ({quote(fk.column.name)})"
+                if fk.ondelete:
+                    definition += f" ON DELETE {fk.ondelete}"
+            with bind.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {quote(table.name)} ADD COLUMN {definition}"))
+
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind=bind)
+
+
+if __name__ == "__main__":
+    create_schema()
+    print("Database schema is up to date")
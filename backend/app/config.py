@@ -48,6 +48,55 @@ CORS_ALLOW_ORIGINS = _get_list_env(
     ["http://localhost:3000", "http://10.10.7.81:3000"],
 )
 
-AUTO_CREATE_TABLES = _get_bool_env("AUTO_CREATE_TABLES", True)
+# Schema is normally created with `python -m app.bootstrap`; when enabled the
+# app also creates it at startup (never at import time).
+AUTO_CREATE_TABLES = _get_bool_env("AUTO_CREATE_TABLES", False)
 MAX_UPLOAD_FILES = _get_int_env("MAX_UPLOAD_FILES", 20)
 MAX_UPLOAD_FILE_SIZE_BYTES = _get_int_env("MAX_UPLOAD_FILE_SIZE_BYTES", 5 * 1024 * 1024)
+
+RESULT_CACHE_MAX_ENTRIES = _get_int_env("RESULT_CACHE_MAX_ENTRIES", 256)
+COMPLETED_ANALYSIS_MAX_AGE_SECONDS = _get_int_env("COMPLETED_ANALYSIS_MAX_AGE_SECONDS", 300)
+HISTORY_PAGE_SIZE = _get_int_env("HISTORY_PAGE_SIZE", 10)
+HISTORY_MAX_PAGE_SIZE = _get_int_env("HISTORY_MAX_PAGE_SIZE", 100)
+
+# auto / orjson / msgspec / json
+JSON_CODEC = os.getenv("JSON_CODEC", "auto").strip().lower()
+
+MAX_ARCHIVE_SIZE_BYTES = _get_int_env("MAX_ARCHIVE_SIZE_BYTES", 200 * 1024 * 1024)
+MAX_ARCHIVE_MEMBERS = _get_int_env("MAX_ARCHIVE_MEMBERS", 1000)
+# All entries, including directories and skipped non-resume files
+MAX_ARCHIVE_ENTRIES = _get_int_env("MAX_ARCHIVE_ENTRIES", 5000)
+MAX_ARCHIVE_UNCOMPRESSED_BYTES = _get_int_env("MAX_ARCHIVE_UNCOMPRESSED_BYTES", 1024 * 1024 * 1024)
+MAX_ARCHIVE_COMPRESSION_RATIO = _get_int_env("MAX_ARCHIVE_COMPRESSION_RATIO", 100)
+
+# Point the Gemini SDK at another endpoint, e.g. a local stub server
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "").strip()
+GEMINI_HTTP_MAX_CONNECTIONS = _get_int_env("GEMINI_HTTP_MAX_CONNECTIONS", 32)
+GEMINI_HTTP_MAX_KEEPALIVE = _get_int_env("GEMINI_HTTP_MAX_KEEPALIVE", 16)
+GEMINI_HTTP_KEEPALIVE_SECONDS = _get_int_env("GEMINI_HTTP_KEEPALIVE_SECONDS", 60)
+
+# Find name / phone / email locally and only ask Gemini for what is missing
+LOCAL_CONTACT_EXTRACTION = _get_bool_env("LOCAL_CONTACT_EXTRACTION", True)
+
+GEMINI_CALL_TIMEOUT_SECONDS = _get_int_env("GEMINI_CALL_TIMEOUT_SECONDS", 60)
+# Retries of a resume whose Gemini call timed out before it is skipped
+GEMINI_CALL_TIMEOUT_RETRIES = _get_int_env("GEMINI_CALL_TIMEOUT_RETRIES", 1)
+# Whole-analysis budget: a base plus a per-resume allowance, so large
+# archives get proportionally more time
+ANALYSIS_DEADLINE_SECONDS = _get_int_env("ANALYSIS_DEADLINE_SECONDS", 300)
+ANALYSIS_DEADLINE_PER_RESUME_SECONDS = _get_int_env("ANALYSIS_DEADLINE_PER_RESUME_SECONDS", 30)
+GEMINI_MAX_CONCURRENT_CALLS = _get_int_env("GEMINI_MAX_CONCURRENT_CALLS", 32)
+
+# Hedged requests: after a p95-based delay, send a duplicate call and use
+# whichever answers first. At most GEMINI_HEDGE_MAX_PERCENT extra calls.
+GEMINI_HEDGE_ENABLED = _get_bool_env("GEMINI_HEDGE_ENABLED", False)
+GEMINI_HEDGE_MIN_DELAY_MS = _get_int_env("GEMINI_HEDGE_MIN_DELAY_MS", 2000)
+GEMINI_HEDGE_MAX_PERCENT = _get_int_env("GEMINI_HEDGE_MAX_PERCENT", 10)
+
+# zlib / zstd (needs the zstandard package) / none
+STORAGE_COMPRESSION = os.getenv("STORAGE_COMPRESSION", "zlib").strip().lower()
+STORAGE_COMPRESSION_MIN_BYTES = _get_int_env("STORAGE_COMPRESSION_MIN_BYTES", 512)
+
+# Analyses older than this are pruned by `python -m app.maintenance prune` (0 = keep forever)
+ANALYSIS_RETENTION_DAYS = _get_int_env("ANALYSIS_RETENTION_DAYS", 0)
+MAINTENANCE_BATCH_SIZE = _get_int_env("MAINTENANCE_BATCH_SIZE", 500)
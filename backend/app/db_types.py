@@ -0,0 +1,80 @@
+import base64
+import zlib
+
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.types import DateTime, Text, TypeDecorator
+
+from .config import STORAGE_COMPRESSION, STORAGE_COMPRESSION_MIN_BYTES
+
+# Stored values start with a marker naming the codec. Anything without a
+# marker is legacy plain text and is returned unchanged.
+ZLIB_PREFIX = "$zlib$"
+ZSTD_PREFIX = "$zstd$"
+
+
+def _zstd():
+    import zstandard
+
+    return zstandard
+
+
+def compress_text(value: str, codec: str = STORAGE_COMPRESSION) -> str:
+    raw = value.encode("utf-8")
+    if codec == "none" or len(raw) < STORAGE_COMPRESSION_MIN_BYTES:
+        return value
+
+    if codec == "zstd":
+        packed = ZSTD_PREFIX + base64.b64encode(_zstd().ZstdCompressor(level=6).compress(raw)).decode("ascii")
+    elif codec == "zlib":
+        packed = ZLIB_PREFIX + base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+    else:
+        raise RuntimeError(f"Unknown STORAGE_COMPRESSION: {codec}")
+
+    # Short or already-compressed text can grow once base64 encoded
+    return packed if len(packed) < len(value) else value
+
+
+def decompress_text(value: str) -> str:
+    if value.startswith(ZLIB_PREFIX):
+        return zlib.decompress(base64.b64decode(value[len(ZLIB_PREFIX):])).decode("utf-8")
+    if value.startswith(ZSTD_PREFIX):
+        data = base64.b64decode(value[len(ZSTD_PREFIX):])
+        return _zstd().ZstdDecompressor().decompress(data).decode("utf-8")
+    return value
+
+
+def is_compressed(value: str) -> bool:
+    return value.startswith((ZLIB_PREFIX, ZSTD_PREFIX))
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column stored compressed (zlib / zstd, base64 in a TEXT column).
+
+    Reads are transparent and legacy uncompressed rows keep working, so the
+    column type in the database does not change.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return decompress_text(value)
+
+
+# SQLite's CURRENT_TIMESTAMP is stored without fractional seconds, while
+# bound datetimes get ".ffffff" appended. Bind in the stored format so
+# comparisons against server-default timestamps (keyset cursors) are exact.
+ServerTimestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
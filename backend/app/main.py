@@ -1,28 +1,42 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
-from . import models
+from .bootstrap import create_schema
 from .config import AUTO_CREATE_TABLES, CORS_ALLOW_ORIGINS
-from .database import Base, engine
 from .routes import auth_routes
+from .services import gemini_service
+from .services.json_codec import FastJSONResponse
 from app.routes import resume_routes
 
 
-app = FastAPI(openapi_version="3.0.3")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if AUTO_CREATE_TABLES:
+        create_schema()
+    # The async Gemini client is built on first use; only close it here
+    yield
+    await gemini_service.close_async_client()
+
+
+app = FastAPI(
+    openapi_version="3.0.3",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ALLOW_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
-if AUTO_CREATE_TABLES:
-    Base.metadata.create_all(bind=engine)
-
 app.include_router(auth_routes.router)
 app.include_router(resume_routes.router)
 
@@ -38,16 +52,20 @@ def custom_openapi():
         description=app.description,
     )
 
-    body_schema = schema.get("components", {}).get("schemas", {}).get(
-        "Body_analyze_resumes_resumes_analyze_post"
-    )
-    if body_schema:
-        files_prop = body_schema.get("properties", {}).get("files", {})
-        items = files_prop.get("items", {})
-        if items.get("contentMediaType") == "application/octet-stream":
-            items.pop("contentMediaType", None)
-            items["format"] = "binary"
-            files_prop["items"] = items
+    # Render file uploads as OpenAPI 3.0 binary strings
+    components = schema.get("components", {}).get("schemas", {})
+    for body_name in (
+        "Body_analyze_resumes_resumes_analyze_post",
+        "Body_analyze_resume_archive_resumes_analyze_archive_post",
+    ):
+        body_schema = components.get(body_name)
+        if not body_schema:
+            continue
+        for prop in body_schema.get("properties", {}).values():
+            for field in (prop, prop.get("items", {})):
+                if field.get("contentMediaType") == "application/octet-stream":
+                    field.pop("contentMediaType", None)
+                    field["format"] = "binary"
 
     app.openapi_schema = schema
     return app.openapi_schema
@@ -76,6 +94,7 @@ def _status_to_code(status_code: int) -> str:
         422: "validation_error",
         429: "rate_limited",
         500: "internal_error",
+        504: "timeout",
     }
     return mapping.get(status_code, "http_error")
 
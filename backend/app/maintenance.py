@@ -0,0 +1,239 @@
+"""
+Storage maintenance jobs. Each batch runs in its own short transaction so
+the app keeps serving requests while a job runs.
+
+    python -m app.maintenance stats
+    python -m app.maintenance compact [--batch-size 500] [--pause-ms 50]
+    python -m app.maintenance prune [--older-than-days 180] [--archive-dir DIR]
+
+stats    stored vs uncompressed size of the large text columns and the
+         cost of decompressing them on read
+compact  compresses legacy rows and moves inline job descriptions into
+         the deduplicated job_descriptions table
+prune    deletes analyses past the retention period (ANALYSIS_RETENTION_DAYS),
+         optionally archiving them to gzipped JSON lines first
+"""
+import argparse
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import Text, delete, select, type_coerce, update
+
+from .config import ANALYSIS_RETENTION_DAYS, MAINTENANCE_BATCH_SIZE
+from .database import SessionLocal
+from .db_types import compress_text, decompress_text, is_compressed
+from .models import JobDescription, Resume, ResumeAnalysis
+from .services.storage_service import get_or_create_job_description
+
+# (model, column) pairs holding large text
+LARGE_TEXT_COLUMNS = [
+    (ResumeAnalysis, "job_description"),
+    (ResumeAnalysis, "ranked_results"),
+    (Resume, "extracted_text"),
+    (JobDescription, "text"),
+]
+
+
+def _raw(model, name):
+    # Bypass CompressedText to see what is actually stored
+    return type_coerce(getattr(model, name), Text)
+
+
+def _batches(db, model, columns, batch_size, where=None):
+    last_id = 0
+    while True:
+        query = select(model.id, *columns).where(model.id > last_id)
+        if where is not None:
+            query = query.where(where)
+        rows = db.execute(query.order_by(model.id).limit(batch_size)).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def stats(batch_size: int) -> dict:
+    report = {}
+    db = SessionLocal()
+    try:
+        for model, name in LARGE_TEXT_COLUMNS:
+            column = {"rows": 0, "compressed_rows": 0, "stored_bytes": 0, "logical_bytes": 0, "decompress_ms": 0.0}
+            for rows in _batches(db, model, [_raw(model, name)], batch_size):
+                for _, value in rows:
+                    if value is None:
+                        continue
+                    started = time.perf_counter()
+                    text = decompress_text(value)
+                    column["decompress_ms"] += (time.perf_counter() - started) * 1000
+                    column["rows"] += 1
+                    column["compressed_rows"] += is_compressed(value)
+                    column["stored_bytes"] += len(value.encode("utf-8"))
+                    column["logical_bytes"] += len(text.encode("utf-8"))
+
+            logical = column["logical_bytes"]
+            column["saved_percent"] = round(100 * (1 - column["stored_bytes"] / logical), 1) if logical else 0.0
+            column["decompress_ms_per_row"] = round(column["decompress_ms"] / column["rows"], 4) if column["rows"] else 0.0
+            column["decompress_ms"] = round(column["decompress_ms"], 2)
+            report[f"{model.__tablename__}.{name}"] = column
+    finally:
+        db.close()
+    return report
+
+
+def _recompress(db, model, name, batch_size, pause) -> dict:
+    result = {"rows": 0, "bytes_before": 0, "bytes_after": 0}
+    for rows in _batches(db, model, [_raw(model, name)], batch_size):
+        for row_id, value in rows:
+            if value is None or is_compressed(value):
+                continue
+            # Short or incompressible text stays plain; rewriting it is a no-op
+            stored = compress_text(value)
+            if stored == value:
+                continue
+            db.execute(update(model).where(model.id == row_id).values({name: value}))
+            result["rows"] += 1
+            result["bytes_before"] += len(value.encode("utf-8"))
+            result["bytes_after"] += len(stored.encode("utf-8"))
+        db.commit()
+        time.sleep(pause)
+    return result
+
+
+def compact(batch_size: int, pause: float) -> dict:
+    report = {}
+    db = SessionLocal()
+    try:
+        # 1. Inline job descriptions -> deduplicated job_descriptions rows
+        moved = {"rows": 0, "bytes_before": 0}
+        legacy = _raw(ResumeAnalysis, "job_description")
+        for rows in _batches(db, ResumeAnalysis, [legacy], batch_size, where=legacy.isnot(None)):
+            for row_id, value in rows:
+                job_description = get_or_create_job_description(db, decompress_text(value))
+                db.execute(
+                    update(ResumeAnalysis)
+                    .where(ResumeAnalysis.id == row_id)
+                    .values(job_description_id=job_description.id, job_description=None)
+                )
+                moved["rows"] += 1
+                moved["bytes_before"] += len(value.encode("utf-8"))
+            db.commit()
+            time.sleep(pause)
+        report["resume_analyses.job_description -> job_descriptions"] = moved
+
+        # 2. Compress what is still stored as plain text
+        for model, name in LARGE_TEXT_COLUMNS:
+            if (model, name) == (ResumeAnalysis, "job_description"):
+                continue
+            report[f"{model.__tablename__}.{name}"] = _recompress(db, model, name, batch_size, pause)
+    finally:
+        db.close()
+    return report
+
+
+def _archive_rows(db, ids, fh):
+    rows = db.query(ResumeAnalysis).filter(ResumeAnalysis.id.in_(ids)).all()
+    texts = {
+        jd.id: jd.text
+        for jd in db.query(JobDescription).filter(
+            JobDescription.id.in_({row.job_description_id for row in rows if row.job_description_id})
+        )
+    }
+    for row in rows:
+        fh.write(json.dumps({
+            "id": row.id,
+            "user_id": row.user_id,
+            "job_role": row.job_role,
+            "job_description": row.job_description or texts.get(row.job_description_id),
+            "total_resumes": row.total_resumes,
+            "status": row.status,
+            "ranked_results": row.ranked_results,
+            "skipped_files": json.loads(row.skipped_files) if row.skipped_files else None,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+        }) + "\n")
+
+
+def prune(older_than_days: int, batch_size: int, pause: float, archive_dir=None) -> dict:
+    if older_than_days <= 0:
+        raise SystemExit("Retention is disabled: set ANALYSIS_RETENTION_DAYS or --older-than-days")
+
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    report = {"cutoff": cutoff.isoformat(), "analyses_deleted": 0, "job_descriptions_deleted": 0}
+
+    archive = None
+    if archive_dir:
+        os.makedirs(archive_dir, exist_ok=True)
+        path = os.path.join(archive_dir, f"resume_analyses-{datetime.utcnow():%Y%m%dT%H%M%S}.jsonl.gz")
+        archive = gzip.open(path, "wt", encoding="utf-8")
+        report["archive"] = path
+
+    db = SessionLocal()
+    try:
+        while True:
+            ids = db.execute(
+                select(ResumeAnalysis.id)
+                .where(ResumeAnalysis.created_at < cutoff)
+                .order_by(ResumeAnalysis.id)
+                .limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+
+            if archive:
+                _archive_rows(db, ids, archive)
+            db.execute(delete(ResumeAnalysis).where(ResumeAnalysis.id.in_(ids)))
+            db.commit()
+            report["analyses_deleted"] += len(ids)
+            time.sleep(pause)
+
+        # Job descriptions no longer referenced by any analysis. Recent ones
+        # are kept: a new analysis may be about to reference them.
+        referenced = select(ResumeAnalysis.job_description_id).where(
+            ResumeAnalysis.job_description_id.isnot(None)
+        )
+        while True:
+            ids = db.execute(
+                select(JobDescription.id)
+                .where(
+                    JobDescription.id.notin_(referenced),
+                    JobDescription.created_at < cutoff,
+                )
+                .limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+            db.execute(delete(JobDescription).where(JobDescription.id.in_(ids)))
+            db.commit()
+            report["job_descriptions_deleted"] += len(ids)
+            time.sleep(pause)
+    finally:
+        db.close()
+        if archive:
+            archive.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Storage maintenance jobs")
+    parser.add_argument("command", choices=["stats", "compact", "prune"])
+    parser.add_argument("--batch-size", type=int, default=MAINTENANCE_BATCH_SIZE)
+    parser.add_argument("--pause-ms", type=int, default=50, help="Sleep between batches")
+    parser.add_argument("--older-than-days", type=int, default=ANALYSIS_RETENTION_DAYS)
+    parser.add_argument("--archive-dir", help="prune: archive deleted analyses here first")
+    args = parser.parse_args()
+
+    pause = args.pause_ms / 1000
+    if args.command == "stats":
+        report = stats(args.batch_size)
+    elif args.command == "compact":
+        report = compact(args.batch_size, pause)
+    else:
+        report = prune(args.older_than_days, args.batch_size, pause, args.archive_dir)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Index, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
+from .db_types import CompressedText, ServerTimestamp
 from sqlalchemy.sql import func
 
 class User(Base):
@@ -21,7 +22,7 @@ class Resume(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     file_name = Column(String)
-    extracted_text = Column(Text)
+    extracted_text = Column(CompressedText)
     match_score = Column(Integer)
     is_good_fit = Column(Boolean)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -29,6 +30,16 @@ class Resume(Base):
     user_id = Column(Integer, ForeignKey("users.id"))
     owner = relationship("User", back_populates="resumes")
 
+class JobDescription(Base):
+    __tablename__ = "job_descriptions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # sha256 of the text, identical job descriptions are stored once
+    content_hash = Column(String(64), unique=True, index=True, nullable=False)
+    text = Column(CompressedText, nullable=False)
+    created_at = Column(ServerTimestamp, server_default=func.now())
+
+
 class ResumeAnalysis(Base):
     __tablename__ = "resume_analyses"
 
@@ -36,13 +47,27 @@ class ResumeAnalysis(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     job_role = Column(String, nullable=True)
-    job_description = Column(Text)
+    # Legacy inline copy; new analyses reference job_descriptions instead
+    job_description = Column(CompressedText)
+    job_description_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=True, index=True)
 
     total_resumes = Column(Integer)
 
     # Store entire ranking result as JSON string
-    ranked_results = Column(Text, nullable=True)
+    ranked_results = Column(CompressedText, nullable=True)
+    # JSON list of {"file_name", "error"} for archive members that could not be read
+    skipped_files = Column(Text, nullable=True)
     
-    status = Column(String, default="processing")  # processing / completed / failed
+    status = Column(String, default="processing")  # processing / completed / failed / timed_out / ...
+
+    created_at = Column(ServerTimestamp, server_default=func.now())
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    # Serves the per-user history listing (keyset on created_at, id)
+    __table_args__ = (
+        Index(
+            "ix_resume_analyses_user_id_created_at",
+            user_id,
+            created_at.desc(),
+            id.desc(),
+        ),
+    )
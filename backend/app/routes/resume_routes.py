@@ -1,46 +1,163 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Header, HTTPException, BackgroundTasks, Query
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 from io import BytesIO
-from fastapi.responses import StreamingResponse
-from openpyxl import Workbook
-import json
+from fastapi.responses import Response, StreamingResponse
+import base64
+import os
+import tempfile
 from datetime import datetime
 
 from app.database import get_db, SessionLocal
 from app.auth import get_current_user
 from app.models import ResumeAnalysis
 from app.services.resume_parser import extract_text_from_file
+from app.services.archive_service import (
+    get_archive_kind,
+    iter_archive_resumes,
+    validate_archive,
+)
 from app.services.gemini_service import analyze_resume_with_gemini
 from app.services.scoring_service import rank_resumes
+from app.services.storage_service import create_analysis
+from app.services import json_codec
+from app.services.result_cache import etag_matches, make_etag, result_cache
+from app.services.deadlines import Deadline
 from app.services.exceptions import (
+    AnalysisTimeoutError,
+    ArchiveError,
+    CallTimeoutError,
     ForbiddenError,
     QuotaExceededError,
     ResumeAnalysisError,
+    ResumeParseError,
     UnsupportedFileTypeError,
 )
-from app.config import MAX_UPLOAD_FILES, MAX_UPLOAD_FILE_SIZE_BYTES
+from app.config import (
+    ANALYSIS_DEADLINE_PER_RESUME_SECONDS,
+    ANALYSIS_DEADLINE_SECONDS,
+    COMPLETED_ANALYSIS_MAX_AGE_SECONDS,
+    GEMINI_CALL_TIMEOUT_RETRIES,
+    GEMINI_CALL_TIMEOUT_SECONDS,
+    HISTORY_MAX_PAGE_SIZE,
+    HISTORY_PAGE_SIZE,
+    MAX_ARCHIVE_SIZE_BYTES,
+    MAX_UPLOAD_FILES,
+    MAX_UPLOAD_FILE_SIZE_BYTES,
+)
 
 router = APIRouter(prefix="/resumes", tags=["Resume Analysis"])
 
 
+# ============================================================
+# 🔥 HTTP CACHING HELPERS
+# ============================================================
+def _encode_completed_payload(analysis, ranked_results: str) -> bytes:
+    # ranked_results is already JSON, splice it in instead of decoding
+    # and re-encoding the whole result set
+    head = {
+        "analysis_id": analysis.id,
+        "status": analysis.status,
+        "job_role": analysis.job_role,
+        "total_resumes": analysis.total_resumes,
+    }
+    if analysis.skipped_files:
+        head["skipped_files"] = json_codec.loads(analysis.skipped_files)
+
+    head = json_codec.dumps(head)
+    return head[:-1] + b',"results":' + ranked_results.encode("utf-8") + b"}"
+
+
+def _cached_json_response(
+    body: bytes,
+    etag: str,
+    cache_control: str,
+    if_none_match: Optional[str],
+) -> Response:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# ============================================================
+# 🔥 HISTORY CURSOR HELPERS
+# ============================================================
+def _encode_cursor(created_at: datetime, analysis_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{analysis_id}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, analysis_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("ascii").split("|")
+        return datetime.fromisoformat(created_at), int(analysis_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 # ============================================================
 # 🔥 BACKGROUND FUNCTION
 # ============================================================
+def _analyze_with_retries(text: str, job_description: str, deadline: Deadline) -> dict:
+    """
+    Analyze one resume, retrying calls that time out. Raises CallTimeoutError
+    when every attempt timed out, or AnalysisTimeoutError once the whole
+    analysis is out of time.
+    """
+    for attempt in range(GEMINI_CALL_TIMEOUT_RETRIES + 1):
+        try:
+            return analyze_resume_with_gemini(
+                text,
+                job_description,
+                timeout=deadline.call_timeout(GEMINI_CALL_TIMEOUT_SECONDS)
+            )
+        except CallTimeoutError as e:
+            # The call was cut short by the analysis deadline, not its own limit
+            if deadline.remaining() <= 0:
+                raise AnalysisTimeoutError("Analysis deadline exceeded") from e
+            if attempt == GEMINI_CALL_TIMEOUT_RETRIES:
+                raise
+
+
 def process_resume_analysis(
     analysis_id: int,
     job_description: str,
-    files_data: List[dict]
+    files_data: Iterable[dict],
+    skip_unreadable: bool = False
 ):
     db = SessionLocal()
 
     try:
         extracted_resumes = []
+        skipped_files = []
+        deadline = Deadline(ANALYSIS_DEADLINE_SECONDS)
 
         for file in files_data:
-            text = extract_text_from_file(BytesIO(file["content"]), file["filename"])
-
-            result = analyze_resume_with_gemini(text, job_description)
+            # Archives are streamed, so the budget grows as resumes arrive
+            deadline.extend(ANALYSIS_DEADLINE_PER_RESUME_SECONDS)
+
+            try:
+                if file.get("error"):
+                    raise ArchiveError(file["error"])
+                text = extract_text_from_file(BytesIO(file["content"]), file["filename"])
+            except ResumeParseError as e:
+                # One corrupt, encrypted or oversized file should not fail a whole archive
+                if not skip_unreadable:
+                    raise
+                skipped_files.append({"file_name": file["filename"], "error": str(e)})
+                continue
+
+            try:
+                result = _analyze_with_retries(text, job_description, deadline)
+            except CallTimeoutError as e:
+                # One hung call only costs its resume, not the whole batch
+                skipped_files.append({"file_name": file["filename"], "error": str(e)})
+                continue
 
             extracted_resumes.append({
                 "file_name": file["filename"],
@@ -56,10 +173,13 @@ def process_resume_analysis(
             return
 
         analysis.total_resumes = len(final_results)
-        analysis.ranked_results = json.dumps(final_results)
+        analysis.ranked_results = json_codec.dumps(final_results).decode("utf-8")
+        if skipped_files:
+            analysis.skipped_files = json_codec.dumps(skipped_files).decode("utf-8")
         analysis.status = "completed"
 
         db.commit()
+        result_cache.invalidate(analysis_id)
 
     except Exception as e:
 
@@ -75,6 +195,9 @@ def process_resume_analysis(
         elif isinstance(e, ForbiddenError):
             analysis.status = "forbidden"
 
+        elif isinstance(e, AnalysisTimeoutError):
+            analysis.status = "timed_out"
+
         elif isinstance(e, (ResumeAnalysisError, UnsupportedFileTypeError)):
             analysis.status = "failed"
 
@@ -87,6 +210,49 @@ def process_resume_analysis(
         db.close()
 
 
+def process_archive_analysis(
+    analysis_id: int,
+    job_description: str,
+    archive_path: str,
+    archive_kind: str
+):
+    try:
+        # Members are read lazily, one resume in memory at a time
+        process_resume_analysis(
+            analysis_id,
+            job_description,
+            iter_archive_resumes(archive_path, archive_kind),
+            skip_unreadable=True
+        )
+    finally:
+        os.remove(archive_path)
+
+
+async def _spool_upload_to_disk(upload: UploadFile, suffix: str) -> str:
+    chunk_size = 1024 * 1024
+    written = 0
+
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        try:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > MAX_ARCHIVE_SIZE_BYTES:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Archive too large. Maximum size is {MAX_ARCHIVE_SIZE_BYTES} bytes.",
+                    )
+                tmp.write(chunk)
+        except BaseException:
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+
+    return tmp.name
+
+
 # ============================================================
 # POST /resumes/analyze
 # ============================================================
@@ -107,18 +273,7 @@ async def analyze_resumes(
             detail=f"Too many files. Maximum allowed is {MAX_UPLOAD_FILES}.",
         )
 
-    analysis = ResumeAnalysis(
-        user_id=current_user.id,
-        job_role=job_role,
-        job_description=job_description,
-        total_resumes=0,
-        ranked_results=None,
-        status="processing"
-    )
-
-    db.add(analysis)
-    db.commit()
-    db.refresh(analysis)
+    analysis = create_analysis(db, current_user.id, job_role, job_description)
 
     files_data = []
     for file in files:
@@ -152,21 +307,108 @@ async def analyze_resumes(
     }
 
 
+# ============================================================
+# POST /resumes/analyze-archive
+# ============================================================
+@router.post("/analyze-archive")
+async def analyze_resume_archive(
+    background_tasks: BackgroundTasks,
+    job_description: str = Form(...),
+    job_role: str = Form(""),
+    archive: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    archive_kind = get_archive_kind(archive.filename or "")
+    if archive_kind is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported archive format. Upload ZIP or tar.gz.",
+        )
+
+    suffix = ".zip" if archive_kind == "zip" else ".tar.gz"
+    archive_path = await _spool_upload_to_disk(archive, suffix)
+
+    try:
+        validate_archive(archive_path, archive_kind)
+    except ArchiveError as e:
+        os.remove(archive_path)
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        analysis = create_analysis(db, current_user.id, job_role, job_description)
+    except Exception:
+        os.remove(archive_path)
+        raise
+
+    background_tasks.add_task(
+        process_archive_analysis,
+        analysis.id,
+        job_description,
+        archive_path,
+        archive_kind
+    )
+
+    return {
+        "analysis_id": analysis.id,
+        "status": "processing",
+        "message": "Resume archive analysis started in background"
+    }
+
+
 # ============================================================
 # GET /resumes/my-analyses
 # ============================================================
 @router.get("/my-analyses")
 def get_my_analyses(
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    job_role: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    analyses = db.query(ResumeAnalysis) \
-        .filter(ResumeAnalysis.user_id == current_user.id) \
-        .order_by(ResumeAnalysis.created_at.desc()) \
-        .limit(10) \
+    # Column-only projection: job_description / ranked_results are never loaded
+    query = db.query(
+            ResumeAnalysis.id,
+            ResumeAnalysis.job_role,
+            ResumeAnalysis.total_resumes,
+            ResumeAnalysis.status,
+            ResumeAnalysis.created_at,
+        ) \
+        .filter(ResumeAnalysis.user_id == current_user.id)
+
+    if status:
+        query = query.filter(ResumeAnalysis.status == status)
+    if job_role:
+        query = query.filter(ResumeAnalysis.job_role == job_role)
+
+    # Keyset pagination on (created_at, id), newest first. The cursor carries
+    # both values, so it stays valid even if its row is deleted.
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                ResumeAnalysis.created_at < cursor_created_at,
+                and_(
+                    ResumeAnalysis.created_at == cursor_created_at,
+                    ResumeAnalysis.id < cursor_id,
+                ),
+            )
+        )
+
+    analyses = query \
+        .order_by(ResumeAnalysis.created_at.desc(), ResumeAnalysis.id.desc()) \
+        .limit(limit + 1) \
         .all()
 
-    return [
+    next_cursor = None
+    if len(analyses) > limit:
+        analyses = analyses[:limit]
+        next_cursor = _encode_cursor(analyses[-1].created_at, analyses[-1].id)
+
+    payload = [
         {
             "analysis_id": a.id,
             "job_role": a.job_role,
@@ -177,6 +419,19 @@ def get_my_analyses(
         for a in analyses
     ]
 
+    body = json_codec.dumps(jsonable_encoder(payload))
+
+    # History changes whenever an analysis finishes, so always revalidate
+    response = _cached_json_response(
+        body,
+        make_etag(current_user.id, next_cursor, body),
+        "private, no-cache",
+        if_none_match,
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
 
 # ============================================================
 # GET /resumes/{analysis_id}
@@ -184,10 +439,18 @@ def get_my_analyses(
 @router.get("/{analysis_id}")
 def get_analysis_detail(
     analysis_id: int,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    analysis = db.query(ResumeAnalysis) \
+    # Only the small columns; ranked_results is loaded on a cache miss
+    analysis = db.query(
+            ResumeAnalysis.id,
+            ResumeAnalysis.status,
+            ResumeAnalysis.job_role,
+            ResumeAnalysis.total_resumes,
+            ResumeAnalysis.skipped_files,
+        ) \
         .filter(
             ResumeAnalysis.id == analysis_id,
             ResumeAnalysis.user_id == current_user.id
@@ -212,6 +475,13 @@ def get_analysis_detail(
             detail="Access denied. API permission issue."
         )
 
+    # 🔥 504
+    if analysis.status == "timed_out":
+        raise HTTPException(
+            status_code=504,
+            detail="Analysis timed out. Please try again."
+        )
+
     # 🔥 500
     if analysis.status == "failed":
         raise HTTPException(
@@ -220,19 +490,37 @@ def get_analysis_detail(
         )
 
     if analysis.status == "processing":
-        return {
+        body = json_codec.dumps({
             "analysis_id": analysis.id,
             "status": analysis.status,
             "message": "Analysis still processing"
-        }
+        })
+        return _cached_json_response(
+            body,
+            make_etag(analysis.id, analysis.status),
+            "private, no-cache",
+            if_none_match,
+        )
 
-    return {
-        "analysis_id": analysis.id,
-        "status": analysis.status,
-        "job_role": analysis.job_role,
-        "total_resumes": analysis.total_resumes,
-        "results": json.loads(analysis.ranked_results)
-    }
+    cached = result_cache.get(analysis.id)
+
+    if cached is None:
+        ranked_results = db.query(ResumeAnalysis.ranked_results) \
+            .filter(ResumeAnalysis.id == analysis.id) \
+            .scalar()
+
+        body = _encode_completed_payload(analysis, ranked_results or "[]")
+        etag = make_etag(analysis.id, analysis.status, body)
+        result_cache.set(analysis.id, etag, body)
+    else:
+        etag, body = cached
+
+    return _cached_json_response(
+        body,
+        etag,
+        f"private, max-age={COMPLETED_ANALYSIS_MAX_AGE_SECONDS}",
+        if_none_match,
+    )
 
 
 # ============================================================
@@ -258,6 +546,7 @@ def delete_analysis(
 
     db.delete(analysis)
     db.commit()
+    result_cache.invalidate(analysis_id)
 
     return {"message": "Analysis deleted successfully"}
 
@@ -296,7 +585,10 @@ def download_analysis(
             detail="Analysis not ready or failed."
         )
 
-    results = json.loads(analysis.ranked_results)
+    results = json_codec.loads(analysis.ranked_results)
+
+    # Imported lazily to keep app startup fast
+    from openpyxl import Workbook
 
     wb = Workbook()
     ws = wb.active
@@ -323,6 +615,12 @@ def download_analysis(
             r.get("file_name")
         ])
 
+    if analysis.skipped_files:
+        skipped_ws = wb.create_sheet("Skipped Files")
+        skipped_ws.append(["File Name", "Error"])
+        for skipped in json_codec.loads(analysis.skipped_files):
+            skipped_ws.append([skipped["file_name"], skipped["error"]])
+
     stream = BytesIO()
     wb.save(stream)
     stream.seek(0)
@@ -0,0 +1,211 @@
+import os
+import posixpath
+import tarfile
+import zipfile
+import zlib
+from typing import Iterator, Optional
+
+from app.config import (
+    MAX_ARCHIVE_COMPRESSION_RATIO,
+    MAX_ARCHIVE_ENTRIES,
+    MAX_ARCHIVE_MEMBERS,
+    MAX_ARCHIVE_UNCOMPRESSED_BYTES,
+    MAX_UPLOAD_FILE_SIZE_BYTES,
+)
+from .exceptions import ArchiveError
+
+RESUME_EXTENSIONS = (".pdf", ".docx")
+
+
+def get_archive_kind(filename: str) -> Optional[str]:
+    """
+    Return "zip" or "tar" for supported archive names, None otherwise
+    """
+    filename = filename.lower()
+    if filename.endswith(".zip"):
+        return "zip"
+    if filename.endswith((".tar.gz", ".tgz")):
+        return "tar"
+    return None
+
+
+def _is_resume(name: str) -> bool:
+    base = posixpath.basename(name)
+    # Skip macOS metadata (__MACOSX/, ._file.pdf) and other hidden files
+    if not base or base.startswith(".") or name.startswith("__MACOSX/"):
+        return False
+    return base.lower().endswith(RESUME_EXTENSIONS)
+
+
+class _Limits:
+    """
+    Archive-wide guards. Breaking one of these aborts the whole archive;
+    problems with a single member only skip that member.
+    """
+
+    def __init__(self, archive_size: int):
+        self.archive_size = max(archive_size, 1)
+        self.entries = 0
+        self.members = 0
+        self.total_bytes = 0
+
+    def check_entry(self):
+        self.entries += 1
+        if self.entries > MAX_ARCHIVE_ENTRIES:
+            raise ArchiveError(f"Archive has more than {MAX_ARCHIVE_ENTRIES} entries")
+
+    def check_member(self):
+        self.members += 1
+        if self.members > MAX_ARCHIVE_MEMBERS:
+            raise ArchiveError(f"Archive has more than {MAX_ARCHIVE_MEMBERS} resumes")
+
+    def add_bytes(self, size: int):
+        self.total_bytes += size
+        if self.total_bytes > MAX_ARCHIVE_UNCOMPRESSED_BYTES:
+            raise ArchiveError("Archive expands beyond the allowed uncompressed size")
+        if self.total_bytes / self.archive_size > MAX_ARCHIVE_COMPRESSION_RATIO:
+            raise ArchiveError("Archive compression ratio is suspiciously high")
+
+
+def _too_large(name: str) -> str:
+    return f"File too large in archive: {name}. Maximum size is {MAX_UPLOAD_FILE_SIZE_BYTES} bytes."
+
+
+def _skipped(name: str, error: str) -> dict:
+    # Yielded in place of a resume the caller should record and skip
+    return {"filename": name, "content": None, "error": error}
+
+
+def _iter_zip(path: str, limits: _Limits) -> Iterator[dict]:
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as e:
+        raise ArchiveError("Invalid ZIP archive") from e
+
+    with archive:
+        for info in archive.infolist():
+            limits.check_entry()
+            if info.is_dir() or not _is_resume(info.filename):
+                continue
+
+            limits.check_member()
+            if info.file_size > MAX_UPLOAD_FILE_SIZE_BYTES:
+                yield _skipped(info.filename, _too_large(info.filename))
+                continue
+            if info.file_size / max(info.compress_size, 1) > MAX_ARCHIVE_COMPRESSION_RATIO:
+                yield _skipped(info.filename, f"Suspicious compression ratio for {info.filename}")
+                continue
+
+            try:
+                with archive.open(info) as fh:
+                    # Never trust the size in the header: read at most limit + 1 bytes
+                    content = fh.read(MAX_UPLOAD_FILE_SIZE_BYTES + 1)
+            except (zipfile.BadZipFile, zlib.error, RuntimeError, NotImplementedError, EOFError) as e:
+                # Encrypted, corrupt or unsupported compression
+                yield _skipped(info.filename, f"Could not extract {info.filename}: {e}")
+                continue
+
+            limits.add_bytes(len(content))
+            if len(content) > MAX_UPLOAD_FILE_SIZE_BYTES:
+                yield _skipped(info.filename, _too_large(info.filename))
+                continue
+
+            yield {"filename": info.filename, "content": content}
+
+
+def _iter_tar(path: str, limits: _Limits) -> Iterator[dict]:
+    try:
+        # Stream mode: members are decompressed in order, never all at once
+        archive = tarfile.open(path, mode="r|gz")
+    except (tarfile.TarError, OSError) as e:
+        raise ArchiveError("Invalid tar.gz archive") from e
+
+    with archive:
+        try:
+            for member in archive:
+                # Stream mode decompresses every member, skipped ones included,
+                # so all of them count towards the size and ratio limits
+                limits.check_entry()
+                limits.add_bytes(member.size)
+                if not member.isfile() or not _is_resume(member.name):
+                    continue
+
+                limits.check_member()
+                if member.size > MAX_UPLOAD_FILE_SIZE_BYTES:
+                    yield _skipped(member.name, _too_large(member.name))
+                    continue
+
+                fh = archive.extractfile(member)
+                if fh is None:
+                    continue
+
+                yield {"filename": member.name, "content": fh.read()}
+        except (tarfile.TarError, OSError, EOFError) as e:
+            raise ArchiveError("Corrupt tar.gz archive") from e
+
+
+def _validate_zip(path: str):
+    # The central directory is read without decompressing anything, so
+    # obvious problems are reported at upload instead of in the background
+    try:
+        with zipfile.ZipFile(path) as archive:
+            infos = archive.infolist()
+    except zipfile.BadZipFile as e:
+        raise ArchiveError("Invalid ZIP archive") from e
+
+    if len(infos) > MAX_ARCHIVE_ENTRIES:
+        raise ArchiveError(f"Archive has more than {MAX_ARCHIVE_ENTRIES} entries")
+
+    resumes = [info for info in infos if not info.is_dir() and _is_resume(info.filename)]
+    if not resumes:
+        raise ArchiveError("No PDF or DOCX resumes found in archive")
+    if len(resumes) > MAX_ARCHIVE_MEMBERS:
+        raise ArchiveError(f"Archive has more than {MAX_ARCHIVE_MEMBERS} resumes")
+
+    # At most limit + 1 bytes are read per member, larger ones are skipped
+    declared = sum(min(info.file_size, MAX_UPLOAD_FILE_SIZE_BYTES + 1) for info in resumes)
+    if declared > MAX_ARCHIVE_UNCOMPRESSED_BYTES:
+        raise ArchiveError("Archive expands beyond the allowed uncompressed size")
+    if declared / max(os.path.getsize(path), 1) > MAX_ARCHIVE_COMPRESSION_RATIO:
+        raise ArchiveError("Archive compression ratio is suspiciously high")
+
+
+def validate_archive(path: str, kind: str):
+    """
+    Cheap up-front check that the file looks like the claimed archive type
+    (and for ZIP, that its central directory is within the limits)
+    """
+    if kind == "zip":
+        _validate_zip(path)
+    elif kind == "tar":
+        with open(path, "rb") as fh:
+            if fh.read(2) != b"\x1f\x8b":
+                raise ArchiveError("Invalid tar.gz archive")
+    else:
+        raise ArchiveError("Unsupported archive format. Upload ZIP or tar.gz.")
+
+
+def iter_archive_resumes(path: str, kind: str) -> Iterator[dict]:
+    """
+    Stream PDF / DOCX members of a ZIP or tar.gz archive one at a time as
+    {"filename", "content"} dicts, enforcing size, count and ratio limits.
+
+    A member that cannot be used on its own (too large, suspicious ratio,
+    encrypted) is yielded with content None and an "error" message instead.
+    """
+    limits = _Limits(os.path.getsize(path))
+
+    if kind == "zip":
+        members = _iter_zip(path, limits)
+    elif kind == "tar":
+        members = _iter_tar(path, limits)
+    else:
+        raise ArchiveError("Unsupported archive format. Upload ZIP or tar.gz.")
+
+    found = False
+    for member in members:
+        found = True
+        yield member
+
+    if not found:
+        raise ArchiveError("No PDF or DOCX resumes found in archive")
@@ -0,0 +1,151 @@
+import re
+from typing import Optional
+
+CONTACT_FIELDS = ("name", "contact_number", "email")
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._%+-]*@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+
+# Loose candidate match, validated afterwards. "/" is not a phone separator,
+# so "06/2018 - 09/2021" never forms one candidate.
+PHONE_RE = re.compile(r"(?<![\w+])(?:\+|00)?\(?\d[\d\s().\-]{6,20}\d(?!\w)")
+
+PHONE_LABEL_RE = re.compile(r"\b(?:phone|mobile|mob|cell|contact|tel|telephone|ph)\b", re.IGNORECASE)
+
+# "2015 - 2021", "06.2018 - 09.2021", "(2012 - 2016"
+_MONTH_YEAR = r"(?:(?:0?[1-9]|1[0-2])\s*[.\-]\s*)?(?:19|20)\d{2}"
+DATE_RANGE_RE = re.compile(rf"^{_MONTH_YEAR}(?:\s*-\s*{_MONTH_YEAR})?$")
+
+# Digit groupings accepted without a label or a +, 00, ( prefix:
+# 9876543210, 98450 12345, 217 555 0143, 011 2345 6789, 0141 234 5678.
+# Anything else (4-4-4 ID numbers, year pairs, ...) is left to the LLM.
+PHONE_GROUPINGS = {(10,), (5, 5), (3, 3, 4), (3, 4, 4), (4, 3, 4)}
+
+NAME_LABEL_RE = re.compile(r"^\s*(?:full\s+)?name\s*[:\-]\s*", re.IGNORECASE)
+NAME_TOKEN_RE = re.compile(r"^[A-Za-z][A-Za-z.'\-]*$")
+NAME_STOP_WORDS = {
+    "resume", "curriculum", "vitae", "cv", "profile", "summary", "objective",
+    "contact", "email", "phone", "mobile", "address", "skills", "experience",
+    "education", "projects", "career", "professional", "personal", "details",
+    "linkedin", "github", "portfolio", "engineer", "developer", "manager",
+    "intern", "analyst", "consultant", "designer", "architect", "scientist",
+    "data", "senior", "junior", "lead", "specialist", "executive", "officer",
+    "administrator", "associate", "programmer", "tester", "director",
+}
+# Name and unlabelled phone numbers are only looked for in the first
+# non-empty lines; further down digits are CTC figures, patent numbers, ...
+HEADER_LINES = 8
+
+
+def extract_email(text: str) -> Optional[str]:
+    match = EMAIL_RE.search(text)
+    return match.group(0).rstrip(".") if match else None
+
+
+def _valid_phone(candidate: str, labelled: bool = False) -> bool:
+    if DATE_RANGE_RE.match(candidate.strip("() ")):
+        return False
+
+    groups = re.findall(r"\d+", candidate)
+    digits = sum(len(group) for group in groups)
+    if candidate.startswith(("+", "00", "(")):
+        return 8 <= digits <= 15
+    if labelled:
+        return 10 <= digits <= 13
+
+    shape = tuple(len(group) for group in groups)
+    return shape in PHONE_GROUPINGS or (shape == (11,) and candidate.startswith("0"))
+
+
+def _clean_phone(candidate: str) -> str:
+    return " ".join(candidate.split()).strip(" .-")
+
+
+def _phone_in_line(line: str) -> Optional[str]:
+    labelled = bool(PHONE_LABEL_RE.search(line))
+    for match in PHONE_RE.finditer(line):
+        candidate = match.group(0)
+        if _valid_phone(candidate, labelled):
+            return _clean_phone(candidate)
+    return None
+
+
+def _header_lines(text: str) -> list[str]:
+    return [line for line in text.splitlines() if line.strip()][:HEADER_LINES]
+
+
+def extract_phone(text: str) -> Optional[str]:
+    # Labelled lines ("Phone: ...") anywhere first, then the header block
+    labelled = [line for line in text.splitlines() if PHONE_LABEL_RE.search(line)]
+    for line in labelled + _header_lines(text):
+        phone = _phone_in_line(line)
+        if phone:
+            return phone
+    return None
+
+
+def _name_from_line(line: str) -> Optional[str]:
+    line = NAME_LABEL_RE.sub("", line).strip(" \t|,•-")
+    # "JOHN SMITH | Software Engineer" -> "JOHN SMITH"
+    line = re.split(r"\s*[|•·,]\s*", line)[0]
+    if not line or "@" in line or "http" in line.lower() or any(ch.isdigit() for ch in line):
+        return None
+
+    tokens = line.split()
+    if not 2 <= len(tokens) <= 4:
+        return None
+    if any(not NAME_TOKEN_RE.match(token) for token in tokens):
+        return None
+    if any(token.lower().strip(".") in NAME_STOP_WORDS for token in tokens):
+        return None
+
+    if line.isupper():
+        return " ".join(token.capitalize() for token in tokens)
+    if all(token[0].isupper() for token in tokens):
+        return " ".join(tokens)
+    return None
+
+
+def _matches_email(name: str, email: Optional[str]) -> bool:
+    # "Priya Sharma" / priya.sharma@..., "RAHUL VERMA" / rahul.verma92@...
+    # Two tokens, so "Team Player" / team.lead@... is not enough
+    local_part = email.split("@", 1)[0].lower() if email else ""
+    return sum(len(token) > 1 and token.lower() in local_part for token in name.split()) >= 2
+
+
+def extract_name(text: str) -> Optional[str]:
+    lines = _header_lines(text)
+
+    for line in lines:
+        if NAME_LABEL_RE.match(line):
+            name = _name_from_line(line)
+            if name:
+                return name
+
+    # The name heads the block that ends with the first email / phone line.
+    # Several plausible lines ("New Delhi" above "Aarav Sharma") are
+    # ambiguous, and a lone heading ("Product Owner", "Team Player") looks
+    # like a name too: without a label the candidate must also match the
+    # email address, otherwise the LLM decides.
+    contact_index = next(
+        (index for index, line in enumerate(lines) if EMAIL_RE.search(line) or _phone_in_line(line)),
+        None,
+    )
+    if contact_index is None:
+        return None
+    candidates = {name for name in map(_name_from_line, lines[:contact_index + 1]) if name}
+    if len(candidates) != 1:
+        return None
+    name = candidates.pop()
+    return name if _matches_email(name, extract_email(text)) else None
+
+
+def extract_contact_fields(text: str) -> dict:
+    """
+    Find name, contact_number and email in resume text without the LLM.
+    Fields that cannot be found reliably are None.
+    """
+    return {
+        "name": extract_name(text),
+        "contact_number": extract_phone(text),
+        "email": extract_email(text),
+    }
@@ -0,0 +1,211 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from app.config import GEMINI_MAX_CONCURRENT_CALLS
+from .exceptions import AnalysisTimeoutError, CallTimeoutError
+
+T = TypeVar("T")
+
+# Calls run here so the caller can stop waiting at its deadline
+_executor = ThreadPoolExecutor(
+    max_workers=GEMINI_MAX_CONCURRENT_CALLS,
+    thread_name_prefix="gemini-call",
+)
+
+
+class Deadline:
+    """
+    Overall time budget, e.g. for a whole analysis
+    """
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def extend(self, seconds: float):
+        self.expires_at += seconds
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def call_timeout(self, per_call_seconds: float) -> float:
+        """
+        Timeout for the next call: the per-call limit, capped by what is left
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise AnalysisTimeoutError("Analysis deadline exceeded")
+        return min(per_call_seconds, remaining)
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent call durations (seconds)
+    """
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """
+    Caps hedged (duplicate) calls at a fraction of all calls
+    """
+
+    def __init__(self, max_fraction: float):
+        self.max_fraction = max_fraction
+        self.calls = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def record_call(self):
+        with self._lock:
+            self.calls += 1
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.calls * self.max_fraction:
+                return False
+            self.hedges += 1
+            return True
+
+
+def call_with_deadline(
+    fn: Callable[[float], T],
+    timeout: float,
+    tracker: Optional[LatencyTracker] = None,
+    hedge_delay: Optional[float] = None,
+    hedge_budget: Optional[HedgeBudget] = None,
+) -> T:
+    """
+    Run fn(timeout) and return its result within `timeout` seconds.
+
+    If hedge_delay is set and the call has not finished by then, a duplicate
+    call is started (when the budget allows) and the first success wins.
+    Raises CallTimeoutError when nothing succeeds in time, or the last
+    error when every attempt failed.
+    """
+    started = time.monotonic()
+    if hedge_budget is not None:
+        hedge_budget.record_call()
+
+    pending = {_executor.submit(fn, timeout)}
+    hedged = hedge_delay is None or hedge_delay >= timeout
+    last_error = None
+
+    while pending:
+        elapsed = time.monotonic() - started
+        if elapsed >= timeout:
+            break
+
+        wait_for = timeout - elapsed
+        if not hedged:
+            wait_for = min(wait_for, max(hedge_delay - elapsed, 0))
+
+        done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            error = future.exception()
+            if error is None:
+                if tracker is not None:
+                    tracker.record(time.monotonic() - started)
+                for other in pending:
+                    other.cancel()
+                return future.result()
+            last_error = error
+
+        if not hedged and not done and time.monotonic() - started >= hedge_delay:
+            hedged = True
+            if hedge_budget is None or hedge_budget.try_acquire():
+                remaining = timeout - (time.monotonic() - started)
+                pending.add(_executor.submit(fn, remaining))
+
+    if not pending and last_error is not None:
+        raise last_error
+
+    # Record the slow call so the hedge delay adapts to the tail
+    if tracker is not None:
+        tracker.record(timeout)
+    for future in pending:
+        future.cancel()
+    raise CallTimeoutError(f"Gemini call timed out after {timeout:.1f}s")
+
+
+async def async_call_with_deadline(
+    fn: Callable[[float], Awaitable[T]],
+    timeout: float,
+    tracker: Optional[LatencyTracker] = None,
+    hedge_delay: Optional[float] = None,
+    hedge_budget: Optional[HedgeBudget] = None,
+) -> T:
+    """
+    Async version of call_with_deadline. Losing and timed-out attempts are
+    cancelled instead of being left to finish in the background.
+    """
+    started = time.monotonic()
+    if hedge_budget is not None:
+        hedge_budget.record_call()
+
+    pending = {asyncio.ensure_future(fn(timeout))}
+    hedged = hedge_delay is None or hedge_delay >= timeout
+    last_error = None
+
+    try:
+        while pending:
+            elapsed = time.monotonic() - started
+            if elapsed >= timeout:
+                break
+
+            wait_for = timeout - elapsed
+            if not hedged:
+                wait_for = min(wait_for, max(hedge_delay - elapsed, 0))
+
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=wait_for,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    if tracker is not None:
+                        tracker.record(time.monotonic() - started)
+                    return task.result()
+                last_error = error
+
+            if not hedged and not done and time.monotonic() - started >= hedge_delay:
+                hedged = True
+                if hedge_budget is None or hedge_budget.try_acquire():
+                    remaining = timeout - (time.monotonic() - started)
+                    pending.add(asyncio.ensure_future(fn(remaining)))
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if not pending and last_error is not None:
+        raise last_error
+
+    if tracker is not None:
+        tracker.record(timeout)
+    raise CallTimeoutError(f"Gemini call timed out after {timeout:.1f}s")
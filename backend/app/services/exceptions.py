@@ -16,3 +16,15 @@ class ResumeParseError(ResumeAnalysisError):
 
 class UnsupportedFileTypeError(ResumeParseError):
     pass
+
+
+class ArchiveError(ResumeParseError):
+    pass
+
+
+class AnalysisTimeoutError(ResumeAnalysisError):
+    pass
+
+
+class CallTimeoutError(AnalysisTimeoutError):
+    pass
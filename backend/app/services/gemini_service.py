@@ -1,28 +1,132 @@
-from google import genai
-from google.genai import types
 import json
+import threading
+from typing import Optional
 
-from app.config import GOOGLE_API_KEY
-from .exceptions import ForbiddenError, QuotaExceededError, ResumeAnalysisError
-
-client = genai.Client(api_key=GOOGLE_API_KEY) if GOOGLE_API_KEY else None
+from app.config import (
+    GEMINI_BASE_URL,
+    GEMINI_CALL_TIMEOUT_SECONDS,
+    GEMINI_HEDGE_ENABLED,
+    GEMINI_HEDGE_MAX_PERCENT,
+    GEMINI_HEDGE_MIN_DELAY_MS,
+    GEMINI_HTTP_KEEPALIVE_SECONDS,
+    GEMINI_HTTP_MAX_CONNECTIONS,
+    GEMINI_HTTP_MAX_KEEPALIVE,
+    GOOGLE_API_KEY,
+    LOCAL_CONTACT_EXTRACTION,
+)
+from .contact_extractor import CONTACT_FIELDS, extract_contact_fields
+from .deadlines import (
+    HedgeBudget,
+    LatencyTracker,
+    async_call_with_deadline,
+    call_with_deadline,
+)
+from .exceptions import (
+    AnalysisTimeoutError,
+    ForbiddenError,
+    QuotaExceededError,
+    ResumeAnalysisError,
+)
 
 MODEL_NAME = "gemini-2.5-flash"
 
+# Created on first use: importing google.genai and building the client is
+# the most expensive part of app startup.
+_client = None
+_client_lock = threading.Lock()
 
-def analyze_resume_with_gemini(resume_text: str, job_description: str):
-    if client is None:
-        raise ResumeAnalysisError("GOOGLE_API_KEY is not configured")
+# Async client and its pooled httpx client, created at app startup
+_async_client = None
+_async_http_client = None
+
+# Recent call latencies drive the hedge delay (p95 of recent calls)
+_latency = LatencyTracker()
+_hedge_budget = HedgeBudget(GEMINI_HEDGE_MAX_PERCENT / 100)
+HEDGE_MIN_SAMPLES = 20
+
+
+def get_client():
+    global _client
+    if _client is None and GOOGLE_API_KEY:
+        with _client_lock:
+            if _client is None:
+                from google import genai
+                from google.genai import types
+
+                _client = genai.Client(
+                    api_key=GOOGLE_API_KEY,
+                    http_options=types.HttpOptions(base_url=GEMINI_BASE_URL or None),
+                )
+    return _client
+
+
+def set_client(client):
+    """
+    Replace the Gemini client (used by benchmarks to inject a fake client)
+    """
+    global _client
+    _client = client
+
+
+def init_async_client(transport=None):
+    """
+    Create the async Gemini client on one long-lived, keep-alive httpx pool.
+
+    `transport` (an httpx.AsyncBaseTransport) replaces the network layer,
+    e.g. httpx.MockTransport or a transport to a local stub server.
+    """
+    global _async_client, _async_http_client
+    if _async_client is not None or not GOOGLE_API_KEY:
+        return
+
+    import httpx
+    from google import genai
+    from google.genai import types
 
-    prompt = f"""
+    _async_http_client = httpx.AsyncClient(
+        transport=transport,
+        timeout=GEMINI_CALL_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=GEMINI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=GEMINI_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=GEMINI_HTTP_KEEPALIVE_SECONDS,
+        ),
+    )
+    _async_client = genai.Client(
+        api_key=GOOGLE_API_KEY,
+        http_options=types.HttpOptions(
+            base_url=GEMINI_BASE_URL or None,
+            httpx_async_client=_async_http_client,
+        ),
+    ).aio
+
+
+async def close_async_client():
+    global _async_client, _async_http_client
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+    _async_client = None
+    _async_http_client = None
+
+
+def _hedge_delay() -> Optional[float]:
+    if not GEMINI_HEDGE_ENABLED:
+        return None
+
+    delay = GEMINI_HEDGE_MIN_DELAY_MS / 1000
+    if _latency.count() >= HEDGE_MIN_SAMPLES:
+        delay = max(delay, _latency.percentile(95))
+    return delay
+
+
+def _build_prompt(resume_text: str, job_description: str, contact_fields) -> str:
+    # interview_priority is assigned by rank_resumes, so it is not requested
+    requested = "".join(f"    - {field}\n" for field in contact_fields)
+    return f"""
     Extract candidate information from the resume and compare it with the job description.
 
     Return:
-    - name
-    - contact_number
-    - email
-    - match_score (0-100 based on skill match)
-    - interview_priority (High, Medium, Low based on match_score)
+{requested}    - match_score (0-100 based on skill match)
     - matched_skills (ONLY skills from resume that match the job description)
 
     Job Description:
@@ -32,49 +136,142 @@ def analyze_resume_with_gemini(resume_text: str, job_description: str):
     {resume_text[:4000]}
     """
 
+
+def _generation_config(call_timeout: float, contact_fields):
+    from google.genai import types
+
+    properties = {field: {"type": "string"} for field in contact_fields}
+    properties.update({
+        "match_score": {"type": "number"},
+        "matched_skills": {
+            "type": "array",
+            "items": {"type": "string"}
+        }
+    })
+
+    return types.GenerateContentConfig(
+        temperature=0.2,
+        http_options=types.HttpOptions(timeout=int(call_timeout * 1000)),
+        response_mime_type="application/json",
+        response_schema={
+            "type": "object",
+            "properties": properties,
+            "required": [*contact_fields, "match_score", "matched_skills"]
+        }
+    )
+
+
+def _local_contacts(resume_text: str, use_local_contacts: Optional[bool]) -> dict:
+    """
+    Contact fields found locally; the rest are requested from Gemini
+    """
+    if use_local_contacts is None:
+        use_local_contacts = LOCAL_CONTACT_EXTRACTION
+    if not use_local_contacts:
+        return {}
+    contacts = extract_contact_fields(resume_text)
+    return {field: value for field, value in contacts.items() if value}
+
+
+def _missing_contact_fields(contacts: dict) -> list:
+    return [field for field in CONTACT_FIELDS if field not in contacts]
+
+
+def _translate_error(e: Exception) -> ResumeAnalysisError:
+    msg = str(e).lower()
+    if "quota" in msg or "rate limit" in msg or "429" in msg:
+        return QuotaExceededError("Gemini quota exceeded")
+    if "permission" in msg or "forbidden" in msg or "403" in msg:
+        return ForbiddenError("Gemini access forbidden")
+    return ResumeAnalysisError("Gemini analysis failed")
+
+
+def _parse_response(response) -> dict:
     try:
-        response = client.models.generate_content(
+        return json.loads(response.text)
+    except Exception as e:
+        raise ResumeAnalysisError("Gemini returned invalid JSON response") from e
+
+
+def analyze_resume_with_gemini(
+    resume_text: str,
+    job_description: str,
+    timeout: Optional[float] = None,
+    use_local_contacts: Optional[bool] = None
+):
+    if timeout is None:
+        timeout = GEMINI_CALL_TIMEOUT_SECONDS
+
+    client = get_client()
+    if client is None:
+        raise ResumeAnalysisError("GOOGLE_API_KEY is not configured")
+
+    contacts = _local_contacts(resume_text, use_local_contacts)
+    contact_fields = _missing_contact_fields(contacts)
+    prompt = _build_prompt(resume_text, job_description, contact_fields)
+
+    def generate(call_timeout: float):
+        return client.models.generate_content(
             model=MODEL_NAME,
             contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.2,
-                response_mime_type="application/json",
-                response_schema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "contact_number": {"type": "string"},
-                        "email": {"type": "string"},
-                        "match_score": {"type": "number"},
-                        "interview_priority": {
-                            "type": "string",
-                            "enum": ["High", "Medium", "Low"]
-                        },
-                        "matched_skills": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        }
-                    },
-                    "required": [
-                        "name",
-                        "contact_number",
-                        "email",
-                        "match_score",
-                        "interview_priority",
-                        "matched_skills"
-                    ]
-                }
-            )
+            config=_generation_config(call_timeout, contact_fields)
         )
+
+    try:
+        response = call_with_deadline(
+            generate,
+            timeout,
+            tracker=_latency,
+            hedge_delay=_hedge_delay(),
+            hedge_budget=_hedge_budget,
+        )
+    except AnalysisTimeoutError:
+        raise
     except Exception as e:
-        msg = str(e).lower()
-        if "quota" in msg or "rate limit" in msg or "429" in msg:
-            raise QuotaExceededError("Gemini quota exceeded") from e
-        if "permission" in msg or "forbidden" in msg or "403" in msg:
-            raise ForbiddenError("Gemini access forbidden") from e
-        raise ResumeAnalysisError("Gemini analysis failed") from e
+        raise _translate_error(e) from e
+
+    return {**_parse_response(response), **contacts}
+
+
+async def analyze_resume_with_gemini_async(
+    resume_text: str,
+    job_description: str,
+    timeout: Optional[float] = None,
+    use_local_contacts: Optional[bool] = None
+):
+    """
+    Async counterpart of analyze_resume_with_gemini using the pooled client
+    """
+    if timeout is None:
+        timeout = GEMINI_CALL_TIMEOUT_SECONDS
+
+    init_async_client()
+    client = _async_client
+    if client is None:
+        raise ResumeAnalysisError("GOOGLE_API_KEY is not configured")
+
+    contacts = _local_contacts(resume_text, use_local_contacts)
+    contact_fields = _missing_contact_fields(contacts)
+    prompt = _build_prompt(resume_text, job_description, contact_fields)
+
+    async def generate(call_timeout: float):
+        return await client.models.generate_content(
+            model=MODEL_NAME,
+            contents=prompt,
+            config=_generation_config(call_timeout, contact_fields)
+        )
 
     try:
-        return json.loads(response.text)
+        response = await async_call_with_deadline(
+            generate,
+            timeout,
+            tracker=_latency,
+            hedge_delay=_hedge_delay(),
+            hedge_budget=_hedge_budget,
+        )
+    except AnalysisTimeoutError:
+        raise
     except Exception as e:
-        raise ResumeAnalysisError("Gemini returned invalid JSON response") from e
+        raise _translate_error(e) from e
+
+    return {**_parse_response(response), **contacts}
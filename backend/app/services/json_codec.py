@@ -0,0 +1,114 @@
+import json
+from typing import Any, Callable, NamedTuple
+
+from fastapi.responses import JSONResponse
+
+from app.config import JSON_CODEC
+
+
+class JsonCodec(NamedTuple):
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Any], Any]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Same output as starlette's JSONResponse
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _with_fallback(fast_dumps: Callable[[Any], bytes]) -> Callable[[Any], bytes]:
+    # The fast encoders reject some values stdlib accepts (None / bool dict
+    # keys, ints beyond 64 bits); encode those with stdlib instead of failing
+    def dumps(obj: Any) -> bytes:
+        try:
+            return fast_dumps(obj)
+        except TypeError:
+            return _stdlib_dumps(obj)
+
+    return dumps
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("json", _stdlib_dumps, json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return JsonCodec("orjson", _with_fallback(dumps), orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JsonCodec("msgspec", _with_fallback(encoder.encode), decoder.decode)
+
+
+_FACTORIES = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def available_codecs() -> dict[str, JsonCodec]:
+    """
+    All codecs that can be used in this environment
+    """
+    codecs = {}
+    for name, factory in _FACTORIES.items():
+        try:
+            codecs[name] = factory()
+        except ImportError:
+            continue
+    return codecs
+
+
+def _select_codec(name: str) -> JsonCodec:
+    if name != "auto":
+        if name not in _FACTORIES:
+            raise RuntimeError(f"Unknown JSON_CODEC: {name}")
+        return _FACTORIES[name]()
+
+    # Fastest installed backend first, stdlib json always works
+    for factory in _FACTORIES.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+
+
+codec = _select_codec(JSON_CODEC)
+
+
+def dumps(obj: Any) -> bytes:
+    return codec.dumps(obj)
+
+
+def loads(data: Any) -> Any:
+    return codec.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with the configured codec (orjson / msgspec / json).
+
+    Output is equivalent JSON to starlette's JSONResponse but not always
+    byte-identical: orjson and msgspec format floats differently (1e16
+    rather than 1e+16).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
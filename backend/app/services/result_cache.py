@@ -0,0 +1,80 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import RESULT_CACHE_MAX_ENTRIES
+
+
+class ResultCache:
+    """
+    Small thread-safe LRU of serialized analysis payloads keyed by analysis id.
+    Only completed analyses are stored since their results never change
+    until they are deleted or rescored.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, analysis_id: int) -> Optional[tuple[str, bytes]]:
+        with self._lock:
+            entry = self._entries.get(analysis_id)
+            if entry is not None:
+                self._entries.move_to_end(analysis_id)
+            return entry
+
+    def set(self, analysis_id: int, etag: str, body: bytes):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[analysis_id] = (etag, body)
+            self._entries.move_to_end(analysis_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, analysis_id: int):
+        with self._lock:
+            self._entries.pop(analysis_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+result_cache = ResultCache(RESULT_CACHE_MAX_ENTRIES)
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from the given parts (id, status, content ...)
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, bytes):
+            digest.update(part)
+        else:
+            digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison)
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
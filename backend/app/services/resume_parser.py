@@ -1,6 +1,4 @@
 from io import BytesIO
-from PyPDF2 import PdfReader
-from docx import Document
 
 from .exceptions import ResumeParseError, UnsupportedFileTypeError
 
@@ -14,6 +12,9 @@ def extract_text_from_file(file_bytes: BytesIO, filename: str):
     # ================= PDF =================
     if filename.endswith(".pdf"):
         try:
+            # Imported lazily to keep app startup fast
+            from PyPDF2 import PdfReader
+
             reader = PdfReader(file_bytes)
             text = ""
 
@@ -30,6 +31,8 @@ def extract_text_from_file(file_bytes: BytesIO, filename: str):
     # ================= DOCX =================
     elif filename.endswith(".docx"):
         try:
+            from docx import Document
+
             doc = Document(file_bytes)
             text = "\n".join([para.text for para in doc.paragraphs])
             return text.strip()
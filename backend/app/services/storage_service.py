@@ -0,0 +1,65 @@
+import hashlib
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import JobDescription, ResumeAnalysis
+
+
+def job_description_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_or_create_job_description(db: Session, text: str) -> JobDescription:
+    """
+    Return the stored copy of this job description, adding it if it is new
+    """
+    content_hash = job_description_hash(text)
+
+    existing = db.query(JobDescription) \
+        .filter(JobDescription.content_hash == content_hash) \
+        .first()
+    if existing:
+        return existing
+
+    job_description = JobDescription(content_hash=content_hash, text=text)
+    try:
+        # Savepoint so a concurrent insert of the same text only undoes this row
+        with db.begin_nested():
+            db.add(job_description)
+    except IntegrityError:
+        return db.query(JobDescription) \
+            .filter(JobDescription.content_hash == content_hash) \
+            .one()
+
+    return job_description
+
+
+def create_analysis(db: Session, user_id: int, job_role: str, job_description: str) -> ResumeAnalysis:
+    """
+    Insert a "processing" analysis that references its job description.
+
+    An unreferenced job description can be deleted by `maintenance prune`
+    between the lookup and the commit; the insert is then retried once with
+    a freshly created row.
+    """
+    for attempt in range(2):
+        analysis = ResumeAnalysis(
+            user_id=user_id,
+            job_role=job_role,
+            job_description_id=get_or_create_job_description(db, job_description).id,
+            total_resumes=0,
+            ranked_results=None,
+            status="processing"
+        )
+        db.add(analysis)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            if attempt:
+                raise
+            continue
+
+        db.refresh(analysis)
+        return analysis
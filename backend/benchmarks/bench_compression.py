@@ -0,0 +1,90 @@
+"""
+Storage saved and read-path cost of compressed text columns.
+
+Encodes synthetic ranked_results payloads and resume texts with every
+available codec (none / zlib / zstd) and reports stored size and
+per-row compress / decompress time.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_compression --rows 200 --resumes-per-analysis 50
+"""
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from app.db_types import compress_text, decompress_text  # noqa: E402
+from benchmarks.bench_json_codec import make_results  # noqa: E402
+from benchmarks.synthetic_resumes import resume_lines  # noqa: E402
+
+
+def available_codecs() -> list[str]:
+    codecs = ["none", "zlib"]
+    try:
+        import zstandard  # noqa: F401
+
+        codecs.append("zstd")
+    except ImportError:
+        pass
+    return codecs
+
+
+def measure(values: list[str], codec: str) -> dict:
+    logical = sum(len(value.encode("utf-8")) for value in values)
+
+    started = time.perf_counter()
+    stored = [compress_text(value, codec) for value in values]
+    compress_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    for value in stored:
+        decompress_text(value)
+    decompress_ms = (time.perf_counter() - started) * 1000
+
+    stored_bytes = sum(len(value.encode("utf-8")) for value in stored)
+    return {
+        "logical_bytes": logical,
+        "stored_bytes": stored_bytes,
+        "saved_percent": round(100 * (1 - stored_bytes / logical), 1),
+        "compress_ms_per_row": round(compress_ms / len(values), 4),
+        "decompress_ms_per_row": round(decompress_ms / len(values), 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compressed text column benchmark")
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--resumes-per-analysis", type=int, default=50)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    columns = {
+        "ranked_results": [
+            json.dumps(make_results(args.resumes_per_analysis, seed=row))
+            for row in range(args.rows)
+        ],
+        "extracted_text": ["\n".join(resume_lines(row)) for row in range(args.rows)],
+    }
+
+    report = {"rows": args.rows, "columns": {}}
+    print(f"{'column':<16}{'codec':<7}{'stored/logical':>22}{'saved':>8}{'comp ms':>10}{'decomp ms':>11}")
+    for name, values in columns.items():
+        report["columns"][name] = {}
+        for codec in available_codecs():
+            row = measure(values, codec)
+            report["columns"][name][codec] = row
+            print(
+                f"{name:<16}{codec:<7}{row['stored_bytes']:>11}/{row['logical_bytes']:<10}"
+                f"{row['saved_percent']:>7}%{row['compress_ms_per_row']:>10}{row['decompress_ms_per_row']:>11}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Accuracy and latency of local contact extraction on a fixture corpus.
+
+Uses benchmarks/fixtures/contact_corpus.json (hand-written resume headers
+in varied formats, including date ranges and ID numbers that must not be
+taken for phone numbers) plus synthetic resumes with known contact details.
+"wrong" counts values that were found but incorrect: those override Gemini,
+while a missing value only falls back to it.
+With --with-llm the same corpus is also sent to Gemini with local
+extraction disabled (needs GOOGLE_API_KEY) to compare accuracy and latency.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_contact_extraction
+    python -m benchmarks.bench_contact_extraction --with-llm --output contacts.json
+"""
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from app.services.contact_extractor import CONTACT_FIELDS, extract_contact_fields  # noqa: E402
+from benchmarks.load_test import summarize  # noqa: E402
+from benchmarks.synthetic_resumes import resume_lines  # noqa: E402
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "contact_corpus.json")
+
+
+def _normalize(field: str, value):
+    if not value:
+        return None
+    if field == "contact_number":
+        return "".join(ch for ch in value if ch.isdigit() or ch == "+")
+    return " ".join(value.split()).lower()
+
+
+def load_corpus(synthetic: int) -> list[dict]:
+    with open(CORPUS_PATH) as fh:
+        corpus = json.load(fh)
+
+    for index in range(synthetic):
+        lines = resume_lines(index, seed=7)
+        corpus.append({
+            "text": "\n".join(lines),
+            "expected": {
+                "name": lines[0],
+                "email": lines[1].split(": ", 1)[1],
+                "contact_number": lines[2].split(": ", 1)[1],
+            },
+        })
+    return corpus
+
+
+def evaluate(corpus: list[dict], extract) -> dict:
+    correct = {field: 0 for field in CONTACT_FIELDS}
+    # A wrong value overrides Gemini; a missing one only falls back to it
+    wrong = {field: 0 for field in CONTACT_FIELDS}
+    latencies = []
+
+    for case in corpus:
+        started = time.perf_counter()
+        found = extract(case["text"])
+        latencies.append((time.perf_counter() - started) * 1000)
+        for field in CONTACT_FIELDS:
+            value = _normalize(field, found.get(field))
+            if value == _normalize(field, case["expected"].get(field)):
+                correct[field] += 1
+            elif value is not None:
+                wrong[field] += 1
+
+    return {
+        "cases": len(corpus),
+        "accuracy": {field: round(correct[field] / len(corpus), 3) for field in CONTACT_FIELDS},
+        "wrong": {field: round(wrong[field] / len(corpus), 3) for field in CONTACT_FIELDS},
+        "latency_ms": summarize(latencies),
+    }
+
+
+def llm_extract(text: str) -> dict:
+    from app.services.gemini_service import analyze_resume_with_gemini
+
+    return analyze_resume_with_gemini(text, "Any role", use_local_contacts=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local contact extraction benchmark")
+    parser.add_argument("--synthetic", type=int, default=200, help="Synthetic resumes added to the corpus")
+    parser.add_argument("--with-llm", action="store_true", help="Also measure Gemini on the fixture corpus")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {"local": evaluate(load_corpus(args.synthetic), extract_contact_fields)}
+    if args.with_llm:
+        report["llm"] = evaluate(load_corpus(0), llm_extract)
+
+    for mode, row in report.items():
+        accuracy = "  ".join(
+            f"{field} {value:.1%} (wrong {row['wrong'][field]:.1%})"
+            for field, value in row["accuracy"].items()
+        )
+        print(
+            f"{mode:<6} {row['cases']} cases  {accuracy}  "
+            f"p50 {row['latency_ms']['p50']} ms  p95 {row['latency_ms']['p95']} ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
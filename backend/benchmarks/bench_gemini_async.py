@@ -0,0 +1,106 @@
+"""
+Compare the sync (thread per call) and async (pooled client) Gemini paths
+against the local stub server.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_gemini_async --calls 200 --concurrency 50 --latency-ms 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.gemini_stub import serve_stub
+from benchmarks.load_test import summarize
+
+RESUME_TEXT = "Jane Doe\njane@example.com\nPython, FastAPI, SQL, Docker\n" * 20
+JOB_DESCRIPTION = "Backend engineer with Python, FastAPI and SQL"
+
+
+def run_sync(gemini_service, calls: int, concurrency: int) -> dict:
+    latencies = []
+
+    def one(_):
+        started = time.perf_counter()
+        gemini_service.analyze_resume_with_gemini(RESUME_TEXT, JOB_DESCRIPTION)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        # Warm up: build the lazy client and open connections outside the timing
+        list(pool.map(one, range(concurrency)))
+        latencies.clear()
+
+        started = time.perf_counter()
+        list(pool.map(one, range(calls)))
+        wall = time.perf_counter() - started
+    return {"wall_seconds": round(wall, 3), "calls_per_second": round(calls / wall, 1), "latency_ms": summarize(latencies)}
+
+
+async def run_async(gemini_service, calls: int, concurrency: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await gemini_service.analyze_resume_with_gemini_async(RESUME_TEXT, JOB_DESCRIPTION)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    gemini_service.init_async_client()
+    try:
+        # Warm up the connection pool the same way as the sync path
+        await asyncio.gather(*(one() for _ in range(concurrency)))
+        latencies.clear()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(calls)))
+        wall = time.perf_counter() - started
+    finally:
+        await gemini_service.close_async_client()
+    return {"wall_seconds": round(wall, 3), "calls_per_second": round(calls / wall, 1), "latency_ms": summarize(latencies)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async Gemini client benchmark")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=100, help="Stub server latency")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    server, base_url = serve_stub(latency_ms=args.latency_ms)
+
+    os.environ["GEMINI_BASE_URL"] = base_url
+    os.environ["GOOGLE_API_KEY"] = "stub-key"
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("GEMINI_MAX_CONCURRENT_CALLS", str(args.concurrency))
+    os.environ.setdefault("GEMINI_HTTP_MAX_CONNECTIONS", str(args.concurrency))
+
+    from app.services import gemini_service
+
+    try:
+        report = {
+            "config": vars(args),
+            "sync": run_sync(gemini_service, args.calls, args.concurrency),
+            "async": asyncio.run(run_async(gemini_service, args.calls, args.concurrency)),
+        }
+    finally:
+        server.shutdown()
+
+    for mode in ("sync", "async"):
+        row = report[mode]
+        print(
+            f"{mode:<6} {row['calls_per_second']:>8} calls/s  "
+            f"p50 {row['latency_ms']['p50']} ms  p95 {row['latency_ms']['p95']} ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark the JSON paths used for analysis results.
+
+Compares every installed codec (orjson / msgspec / json) on:
+- store:  encoding ranked results for the ranked_results column
+- read:   the old read path (decode + jsonable_encoder + JSONResponse)
+- splice: the current read path (stored JSON spliced into the envelope)
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_json_codec --resumes 500 --repeat 20
+    python -m benchmarks.bench_json_codec --output json_codec.json
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.services.json_codec import available_codecs  # noqa: E402
+
+SKILLS = [
+    "Python", "FastAPI", "SQL", "PostgreSQL", "Docker", "Kubernetes", "AWS",
+    "React", "TypeScript", "Machine Learning", "Pandas", "Git", "CI/CD",
+    "Redis", "Kafka", "GraphQL", "Linux", "Terraform", "Go", "Java",
+]
+
+
+def make_results(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        results.append({
+            "file_name": f"candidate_{i:05d}_resume.pdf",
+            "name": f"Candidate Número {i}",
+            "contact_number": f"+91 98{rng.randint(10000000, 99999999)}",
+            "email": f"candidate{i}@example.com",
+            "match_score": rng.randint(0, 100),
+            "interview_priority": rng.choice(["High", "Medium", "Low"]),
+            "matched_skills": rng.sample(SKILLS, rng.randint(3, 15)),
+        })
+    return results
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(resumes: int, repeat: int) -> dict:
+    results = make_results(resumes)
+    envelope = {
+        "analysis_id": 1,
+        "status": "completed",
+        "job_role": "Backend Engineer",
+        "total_resumes": resumes,
+    }
+    report = {"resumes": resumes, "repeat": repeat, "codecs": {}}
+
+    for name, codec in available_codecs().items():
+        stored = codec.dumps(results).decode("utf-8")
+
+        def store():
+            codec.dumps(results).decode("utf-8")
+
+        def read():
+            payload = {**envelope, "results": codec.loads(stored)}
+            JSONResponse(content=jsonable_encoder(payload))
+
+        def splice():
+            head = codec.dumps(envelope)
+            head[:-1] + b',"results":' + stored.encode("utf-8") + b"}"
+
+        report["codecs"][name] = {
+            "payload_bytes": len(stored.encode("utf-8")),
+            "store_ms": round(_time(store, repeat), 3),
+            "read_decode_reencode_ms": round(_time(read, repeat), 3),
+            "read_splice_ms": round(_time(splice, repeat), 3),
+        }
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    report = run(args.resumes, args.repeat)
+
+    print(f"{args.resumes} resumes, best of {args.repeat} runs (ms)")
+    print(f"{'codec':<10}{'bytes':>10}{'store':>10}{'read':>10}{'splice':>10}")
+    for name, row in report["codecs"].items():
+        print(
+            f"{name:<10}{row['payload_bytes']:>10}{row['store_ms']:>10}"
+            f"{row['read_decode_reencode_ms']:>10}{row['read_splice_ms']:>10}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Measure app import time with `python -X importtime` and check it against a budget.
+
+Imports `app.main` in a fresh interpreter, reports total import time, the
+slowest modules, and fails (exit 1) if the total exceeds --budget-ms or if
+any module that should be loaded lazily (Gemini SDK, PDF/DOCX/Excel
+libraries) was imported at startup.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_startup --budget-ms 1000 --runs 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Heavy modules that must only be imported on first use
+LAZY_MODULES = ["google.genai", "PyPDF2", "docx", "openpyxl"]
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        # "import time:       140 |     583718 |     app.services.gemini_service"
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        name = name[1:]
+        entries.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return entries
+
+
+def measure(module: str) -> dict:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite://")
+    env.setdefault("SECRET_KEY", "benchmark-secret")
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    entries = parse_importtime(proc.stderr)
+    top_level = [entry for entry in entries if entry["depth"] == 0]
+    return {
+        "wall_ms": round(wall_ms, 1),
+        "import_ms": round(sum(entry["cumulative_us"] for entry in top_level) / 1000, 1),
+        "entries": entries,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="App startup (import time) benchmark")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=3, help="Best of N runs is reported")
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda run: run["import_ms"])
+
+    imported = {entry["module"] for entry in best["entries"]}
+    eager = [name for name in LAZY_MODULES if name in imported]
+    slowest = sorted(best["entries"], key=lambda entry: entry["self_us"], reverse=True)[:args.top]
+
+    print(f"import {args.module}: {best['import_ms']} ms (process wall {best['wall_ms']} ms), budget {args.budget_ms} ms")
+    print(f"{'self ms':>9}{'cumul ms':>10}  module")
+    for entry in slowest:
+        print(f"{entry['self_us'] / 1000:>9.1f}{entry['cumulative_us'] / 1000:>10.1f}  {entry['module']}")
+
+    report = {
+        "module": args.module,
+        "runs": [{"wall_ms": run["wall_ms"], "import_ms": run["import_ms"]} for run in runs],
+        "import_ms": best["import_ms"],
+        "budget_ms": args.budget_ms,
+        "eager_heavy_modules": eager,
+        "slowest": [
+            {key: entry[key] for key in ("module", "self_us", "cumulative_us")}
+            for entry in slowest
+        ],
+    }
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+    failed = False
+    if eager:
+        print(f"FAIL: imported at startup, should be lazy: {', '.join(eager)}")
+        failed = True
+    if best["import_ms"] > args.budget_ms:
+        print(f"FAIL: import time {best['import_ms']} ms exceeds budget {args.budget_ms} ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
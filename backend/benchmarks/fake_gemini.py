@@ -0,0 +1,79 @@
+"""
+In-process stand-in for genai.Client used by benchmarks.
+
+Only the parts of the SDK the app calls are implemented:
+client.models.generate_content(model=..., contents=..., config=...).
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+
+
+class FakeGeminiResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModels:
+    def __init__(
+        self,
+        latency_ms: float,
+        jitter_ms: float,
+        error_rate: float,
+        seed: int,
+        slow_rate: float = 0.0,
+        slow_ms: float = 0.0,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    def _next_delay_and_error(self) -> tuple[float, bool]:
+        with self._lock:
+            self.calls += 1
+            delay = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms))
+            # Occasional very slow call to exercise timeouts and hedging
+            if self._rng.random() < self.slow_rate:
+                delay += self.slow_ms
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            return delay / 1000, failed
+
+    def generate_content(self, model: str, contents: str, config=None):
+        delay, failed = self._next_delay_and_error()
+        time.sleep(delay)
+
+        if failed:
+            raise RuntimeError("500 simulated Gemini failure")
+
+        digest = hashlib.sha1(contents.encode("utf-8")).digest()
+        return FakeGeminiResponse(json.dumps({
+            "name": "Synthetic Candidate",
+            "contact_number": "+91 90000 00000",
+            "email": "candidate@example.com",
+            "match_score": digest[0] % 101,
+            "interview_priority": "Medium",
+            "matched_skills": ["Python", "SQL"],
+        }))
+
+
+class FakeGeminiClient:
+    def __init__(
+        self,
+        latency_ms: float = 200,
+        jitter_ms: float = 50,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        slow_rate: float = 0.0,
+        slow_ms: float = 0.0,
+    ):
+        self.models = FakeGeminiModels(latency_ms, jitter_ms, error_rate, seed, slow_rate, slow_ms)
@@ -0,0 +1,88 @@
+"""
+Local stand-in for the Gemini REST API (generateContent only).
+
+Two ways to use it:
+- serve_stub(): a real HTTP server on localhost; point the app at it with
+  GEMINI_BASE_URL=http://127.0.0.1:<port> and any GOOGLE_API_KEY.
+- make_stub_transport(): an httpx.MockTransport for
+  gemini_service.init_async_client(transport=...), no sockets involved.
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+CANNED_RESULT = {
+    "name": "Stub Candidate",
+    "contact_number": "+91 90000 00000",
+    "email": "stub@example.com",
+    "match_score": 72,
+    "interview_priority": "Medium",
+    "matched_skills": ["Python", "SQL"],
+}
+
+
+def generate_content_body() -> bytes:
+    return json.dumps({
+        "candidates": [{
+            "content": {"role": "model", "parts": [{"text": json.dumps(CANNED_RESULT)}]},
+            "finishReason": "STOP",
+        }],
+        "usageMetadata": {"promptTokenCount": 1, "candidatesTokenCount": 1, "totalTokenCount": 2},
+    }).encode("utf-8")
+
+
+def serve_stub(latency_ms: float = 0, port: int = 0):
+    """
+    Start the stub server in a daemon thread; returns (server, base_url)
+    """
+    body = generate_content_body()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+
+            if not self.path.split("?")[0].endswith(":generateContent"):
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        # Default backlog of 5 drops connections under load
+        request_queue_size = 256
+
+    server = Server(("127.0.0.1", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def make_stub_transport(latency_ms: float = 0) -> httpx.MockTransport:
+    body = generate_content_body()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        if not request.url.path.endswith(":generateContent"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    return httpx.MockTransport(handler)
@@ -0,0 +1,346 @@
+"""
+Load test for the resume analysis pipeline.
+
+Starts the app in-process with uvicorn against a throwaway SQLite database
+and a fake Gemini client, then drives it in stages with N concurrent users:
+
+    register -> login -> analyze -> poll (until done) -> download
+
+Each stage reports throughput, p50/p95/p99 latency and peak Python heap
+(tracemalloc). The report is JSON so two runs can be compared:
+
+    python -m benchmarks.load_test --users 16 --output run.json
+    python -m benchmarks.load_test --users 16 --compare run.json
+
+With --compare the exit code is 1 if any stage's p95 latency regressed by
+more than --tolerance.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+STAGES = ["register", "login", "analyze", "poll", "download"]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def summarize(latencies: list[float]) -> dict:
+    return {
+        "p50": round(percentile(latencies, 50), 2),
+        "p95": round(percentile(latencies, 95), 2),
+        "p99": round(percentile(latencies, 99), 2),
+        "max": round(max(latencies), 2) if latencies else 0.0,
+        "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+    }
+
+
+class StageRecorder:
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, started: float, ok: bool):
+        elapsed = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.latencies.append(elapsed)
+            if not ok:
+                self.errors += 1
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args, db_path: str):
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ["GOOGLE_API_KEY"] = ""
+
+    import uvicorn
+
+    from app.bootstrap import create_schema
+    from app.main import app
+    from app.services import gemini_service
+    from benchmarks.fake_gemini import FakeGeminiClient
+
+    create_schema()
+
+    fake = FakeGeminiClient(
+        latency_ms=args.gemini_latency_ms,
+        jitter_ms=args.gemini_jitter_ms,
+        error_rate=args.gemini_error_rate,
+        seed=args.seed,
+        slow_rate=args.gemini_slow_rate,
+        slow_ms=args.gemini_slow_ms,
+    )
+    gemini_service.set_client(fake)
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    while not server.started:
+        time.sleep(0.05)
+
+    return server, thread, f"http://127.0.0.1:{port}", fake
+
+
+def build_uploads(args) -> list[list[tuple[str, bytes]]]:
+    from benchmarks.synthetic_resumes import make_resume
+
+    uploads = []
+    index = 0
+    for _ in range(args.users * args.analyses_per_user):
+        files = []
+        for _ in range(args.files_per_analysis):
+            kind = "pdf" if (index % 100) < args.pdf_percent else "docx"
+            files.append(make_resume(index, kind, args.seed))
+            index += 1
+        uploads.append(files)
+    return uploads
+
+
+def run_stage(name, recorders, workers, jobs, fn, memory, report):
+    if memory:
+        tracemalloc.reset_peak()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(fn, jobs))
+    wall = time.perf_counter() - started
+
+    recorder = recorders[name]
+    stage = {
+        "requests": len(recorder.latencies),
+        "errors": recorder.errors,
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(len(recorder.latencies) / wall, 2) if wall else 0.0,
+        "latency_ms": summarize(recorder.latencies),
+    }
+    if memory:
+        stage["peak_memory_mb"] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+
+    report["stages"][name] = stage
+    return results
+
+
+def run(args) -> dict:
+    if args.memory:
+        tracemalloc.start()
+
+    workdir = tempfile.mkdtemp(prefix="resume-bench-")
+    server, thread, base_url, fake = start_server(args, os.path.join(workdir, "bench.db"))
+    uploads = build_uploads(args)
+    recorders = {name: StageRecorder() for name in STAGES}
+    completion_ms: list[float] = []
+    completion_lock = threading.Lock()
+
+    report = {
+        "config": {
+            key: value for key, value in vars(args).items()
+            if key not in {"output", "compare"}
+        },
+        "stages": {},
+    }
+
+    http = httpx.Client(
+        base_url=base_url,
+        timeout=args.request_timeout,
+        limits=httpx.Limits(max_connections=args.users * 2),
+    )
+
+    def timed(stage, method, url, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = http.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            recorders[stage].record(started, False)
+            return None
+        recorders[stage].record(started, response.status_code < 400)
+        return response
+
+    def register(user):
+        timed("register", "POST", "/auth/register", json={
+            "name": f"Bench User {user}",
+            "email": f"bench{user}@example.com",
+            "password": "benchmark",
+            "confirm_password": "benchmark",
+        })
+        return user
+
+    def login(user):
+        response = timed("login", "POST", "/auth/login", data={
+            "username": f"bench{user}@example.com",
+            "password": "benchmark",
+        })
+        if response is None or response.status_code != 200:
+            return None
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    def analyze(job):
+        headers, files = job
+        if headers is None:
+            return None
+        response = timed(
+            "analyze",
+            "POST",
+            "/resumes/analyze",
+            headers=headers,
+            data={"job_description": args.job_description, "job_role": "Backend Engineer"},
+            files=[("files", (name, content)) for name, content in files],
+        )
+        if response is None or response.status_code != 200:
+            return None
+        return headers, response.json()["analysis_id"], time.perf_counter()
+
+    def poll(job):
+        if job is None:
+            return None
+        headers, analysis_id, submitted = job
+        deadline = time.monotonic() + args.analysis_timeout
+        etag = None
+        while time.monotonic() < deadline:
+            poll_headers = dict(headers)
+            if etag:
+                poll_headers["If-None-Match"] = etag
+            response = timed("poll", "GET", f"/resumes/{analysis_id}", headers=poll_headers)
+            if response is not None:
+                if response.status_code == 200 and response.json().get("status") == "completed":
+                    with completion_lock:
+                        completion_ms.append((time.perf_counter() - submitted) * 1000)
+                    return headers, analysis_id
+                if response.status_code >= 400:
+                    return None
+                etag = response.headers.get("etag", etag)
+            time.sleep(args.poll_interval)
+        return None
+
+    def download(job):
+        if job is None:
+            return None
+        headers, analysis_id = job
+        timed("download", "GET", f"/resumes/{analysis_id}/download", headers=headers)
+
+    try:
+        users = list(range(args.users))
+        run_stage("register", recorders, args.users, users, register, args.memory, report)
+        tokens = run_stage("login", recorders, args.users, users, login, args.memory, report)
+
+        jobs = [
+            (tokens[i % args.users], files)
+            for i, files in enumerate(uploads)
+        ]
+        submitted = run_stage("analyze", recorders, args.users, jobs, analyze, args.memory, report)
+        completed = run_stage("poll", recorders, args.users, submitted, poll, args.memory, report)
+        run_stage("download", recorders, args.users, completed, download, args.memory, report)
+    finally:
+        http.close()
+        server.should_exit = True
+        thread.join(timeout=10)
+        if args.memory:
+            tracemalloc.stop()
+
+    report["analyses"] = {
+        "submitted": len(uploads),
+        "completed": len(completion_ms),
+        "failed": len(uploads) - len(completion_ms),
+        "completion_ms": summarize(completion_ms),
+    }
+    report["gemini"] = {"calls": fake.models.calls, "errors": fake.models.errors}
+    return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, stage in report["stages"].items():
+        before = baseline.get("stages", {}).get(name)
+        if not before:
+            continue
+        old_p95 = before["latency_ms"]["p95"]
+        new_p95 = stage["latency_ms"]["p95"]
+        change = (new_p95 - old_p95) / old_p95 if old_p95 else 0.0
+        line = f"{name:<10} p95 {old_p95:>9.2f} -> {new_p95:>9.2f} ms ({change:+.1%})"
+        print(line)
+        if change > tolerance:
+            regressions.append(line)
+    return regressions
+
+
+def print_report(report: dict):
+    print(f"{'stage':<10}{'reqs':>7}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'peakMB':>9}")
+    for name, stage in report["stages"].items():
+        latency = stage["latency_ms"]
+        print(
+            f"{name:<10}{stage['requests']:>7}{stage['errors']:>6}{stage['throughput_rps']:>9}"
+            f"{latency['p50']:>9}{latency['p95']:>9}{latency['p99']:>9}"
+            f"{stage.get('peak_memory_mb', '-'):>9}"
+        )
+    analyses = report["analyses"]
+    print(
+        f"analyses: {analyses['completed']}/{analyses['submitted']} completed, "
+        f"completion p50 {analyses['completion_ms']['p50']} ms, "
+        f"p95 {analyses['completion_ms']['p95']} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the resume analysis pipeline")
+    parser.add_argument("--users", type=int, default=8, help="Concurrent users")
+    parser.add_argument("--analyses-per-user", type=int, default=2)
+    parser.add_argument("--files-per-analysis", type=int, default=5)
+    parser.add_argument("--pdf-percent", type=int, default=50, help="Share of PDF resumes (rest DOCX)")
+    parser.add_argument("--gemini-latency-ms", type=float, default=200)
+    parser.add_argument("--gemini-jitter-ms", type=float, default=50)
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0)
+    parser.add_argument("--gemini-slow-rate", type=float, default=0.0, help="Share of calls that are very slow")
+    parser.add_argument("--gemini-slow-ms", type=float, default=5000, help="Extra latency of slow calls")
+    parser.add_argument("--poll-interval", type=float, default=0.2)
+    parser.add_argument("--analysis-timeout", type=float, default=300)
+    parser.add_argument("--request-timeout", type=float, default=60)
+    parser.add_argument("--job-description", default="Backend engineer with Python, FastAPI, SQL and Docker")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="Disable tracemalloc")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 regression (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("p95 regressions above tolerance:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Synthetic PDF / DOCX resumes for benchmarks.
+
+PDFs are written by hand (single page, Helvetica text) so no PDF library
+is needed; DOCX files use python-docx, which the app already depends on.
+"""
+import random
+from io import BytesIO
+
+from docx import Document
+
+FIRST_NAMES = ["Aarav", "Priya", "Rahul", "Sneha", "Arjun", "Divya", "Karan", "Meera", "John", "Emily"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Reddy", "Nair", "Gupta", "Singh", "Das", "Smith", "Brown"]
+SKILLS = [
+    "Python", "FastAPI", "Django", "SQL", "PostgreSQL", "Docker", "Kubernetes", "AWS",
+    "React", "TypeScript", "Machine Learning", "Pandas", "Git", "CI/CD", "Redis",
+    "Kafka", "GraphQL", "Linux", "Terraform", "Java", "Spring Boot", "Go",
+]
+COMPANIES = ["Infosys", "TCS", "Wipro", "Zoho", "Flipkart", "Freshworks", "Acme Corp"]
+
+
+def resume_lines(index: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed * 100003 + index)
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+
+    lines = [
+        f"{first} {last}",
+        f"Email: {first.lower()}.{last.lower()}{index}@example.com",
+        f"Phone: +91 {rng.randint(70000, 99999)} {rng.randint(10000, 99999)}",
+        "",
+        "Summary",
+        f"Software engineer with {rng.randint(1, 12)} years of experience building web services.",
+        "",
+        "Skills",
+        ", ".join(rng.sample(SKILLS, rng.randint(5, 12))),
+        "",
+        "Experience",
+    ]
+    for _ in range(rng.randint(2, 4)):
+        lines.append(
+            f"{rng.choice(COMPANIES)} - Software Engineer ({rng.randint(2012, 2020)} - {rng.randint(2021, 2025)})"
+        )
+        for _ in range(3):
+            lines.append(f"- Built and maintained {rng.choice(SKILLS)} services used by {rng.randint(2, 90)}k users.")
+    return lines
+
+
+def _pdf_escape(text: str) -> str:
+    text = text.encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(lines: list[str]) -> bytes:
+    text_ops = ["BT", "/F1 11 Tf", "14 TL", "50 770 Td"]
+    for line in lines:
+        text_ops.append(f"({_pdf_escape(line)}) Tj T*")
+    text_ops.append("ET")
+    stream = "\n".join(text_ops).encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    out = BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{number} 0 obj\n".encode() + body + b"\nendobj\n")
+
+    xref_offset = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n".encode())
+    out.write(b"0000000000 65535 f \n")
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode())
+    out.write(
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n".encode()
+    )
+    return out.getvalue()
+
+
+def make_docx(lines: list[str]) -> bytes:
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    out = BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def make_resume(index: int, kind: str = "pdf", seed: int = 0) -> tuple[str, bytes]:
+    """
+    Return (filename, content) for a synthetic resume of the given kind
+    """
+    lines = resume_lines(index, seed)
+    if kind == "pdf":
+        return f"resume_{index:05d}.pdf", make_pdf(lines)
+    if kind == "docx":
+        return f"resume_{index:05d}.docx", make_docx(lines)
+    raise ValueError(f"Unknown resume kind: {kind}")
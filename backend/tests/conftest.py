@@ -0,0 +1,89 @@
+import os
+import tempfile
+
+# app.config reads these at import time
+os.environ.setdefault(
+    "DATABASE_URL",
+    "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="resume-tests-"), "test.db"),
+)
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+import pytest  # noqa: E402
+
+from app.bootstrap import create_schema  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.models import ResumeAnalysis, User  # noqa: E402
+
+
+@pytest.fixture
+def analysis_id():
+    """
+    A fresh "processing" analysis row for the background-task functions
+    """
+    create_schema()
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == "tests@example.com").first()
+        if user is None:
+            user = User(name="Test", email="tests@example.com", password="x")
+            db.add(user)
+            db.commit()
+        analysis = ResumeAnalysis(user_id=user.id, total_resumes=0, status="processing")
+        db.add(analysis)
+        db.commit()
+        return analysis.id
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def client():
+    """
+    TestClient authenticated as a fresh user; the user's id is on `client.user_id`
+    """
+    from uuid import uuid4
+
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    create_schema()
+    test_client = TestClient(app)
+    email = f"{uuid4().hex}@example.com"
+    test_client.post("/auth/register", json={
+        "name": "Test User",
+        "email": email,
+        "password": "secret1",
+        "confirm_password": "secret1",
+    })
+    token = test_client.post(
+        "/auth/login", data={"username": email, "password": "secret1"}
+    ).json()["access_token"]
+    test_client.headers["Authorization"] = f"Bearer {token}"
+
+    db = SessionLocal()
+    try:
+        test_client.user_id = db.query(User.id).filter(User.email == email).scalar()
+    finally:
+        db.close()
+    return test_client
+
+
+@pytest.fixture
+def make_analysis():
+    """
+    Insert a ResumeAnalysis row and return its id
+    """
+    def make(user_id, **fields):
+        fields.setdefault("total_resumes", 0)
+        fields.setdefault("status", "processing")
+        db = SessionLocal()
+        try:
+            analysis = ResumeAnalysis(user_id=user_id, **fields)
+            db.add(analysis)
+            db.commit()
+            return analysis.id
+        finally:
+            db.close()
+
+    return make
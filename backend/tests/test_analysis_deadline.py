@@ -0,0 +1,93 @@
+import json
+import time
+
+from app.database import SessionLocal
+from app.models import ResumeAnalysis
+from app.routes import resume_routes
+from app.services.exceptions import CallTimeoutError
+
+
+def _run(monkeypatch, analysis_id, base, per_resume, files=4, call_seconds=0.2):
+    monkeypatch.setattr(resume_routes, "ANALYSIS_DEADLINE_SECONDS", base)
+    monkeypatch.setattr(resume_routes, "ANALYSIS_DEADLINE_PER_RESUME_SECONDS", per_resume)
+    monkeypatch.setattr(resume_routes, "extract_text_from_file", lambda stream, filename: filename)
+
+    def slow_gemini(text, job_description, timeout=None):
+        time.sleep(call_seconds)
+        return {"match_score": 70, "matched_skills": []}
+
+    monkeypatch.setattr(resume_routes, "analyze_resume_with_gemini", slow_gemini)
+
+    files_data = ({"filename": f"{i}.pdf", "content": b""} for i in range(files))
+    resume_routes.process_resume_analysis(analysis_id, "Any role", files_data)
+
+    db = SessionLocal()
+    try:
+        return db.get(ResumeAnalysis, analysis_id)
+    finally:
+        db.close()
+
+
+def test_deadline_scales_with_resume_count(monkeypatch, analysis_id):
+    # 4 calls of 0.2s exceed the base budget but not base + 4 * per-resume
+    analysis = _run(monkeypatch, analysis_id, base=0.1, per_resume=0.5)
+
+    assert analysis.status == "completed"
+    assert analysis.total_resumes == 4
+
+
+def test_deadline_still_bounds_slow_analyses(monkeypatch, analysis_id):
+    analysis = _run(monkeypatch, analysis_id, base=0.1, per_resume=0.05)
+
+    assert analysis.status == "timed_out"
+
+
+def test_call_timeout_skips_only_that_resume(monkeypatch, analysis_id):
+    monkeypatch.setattr(resume_routes, "extract_text_from_file", lambda stream, filename: filename)
+    attempts = []
+
+    def gemini(text, job_description, timeout=None):
+        attempts.append(text)
+        if text == "hung.pdf":
+            raise CallTimeoutError("Gemini call timed out after 60.0s")
+        return {"match_score": 70, "matched_skills": []}
+
+    monkeypatch.setattr(resume_routes, "analyze_resume_with_gemini", gemini)
+
+    files_data = [{"filename": name, "content": b""} for name in ("a.pdf", "hung.pdf", "b.pdf")]
+    resume_routes.process_resume_analysis(analysis_id, "Any role", files_data)
+
+    db = SessionLocal()
+    try:
+        analysis = db.get(ResumeAnalysis, analysis_id)
+    finally:
+        db.close()
+    assert analysis.status == "completed"
+    assert analysis.total_resumes == 2
+    assert [s["file_name"] for s in json.loads(analysis.skipped_files)] == ["hung.pdf"]
+    # Retried once before being skipped
+    assert attempts.count("hung.pdf") == resume_routes.GEMINI_CALL_TIMEOUT_RETRIES + 1
+
+
+def test_call_timeout_is_retried(monkeypatch, analysis_id):
+    monkeypatch.setattr(resume_routes, "extract_text_from_file", lambda stream, filename: filename)
+    attempts = []
+
+    def gemini(text, job_description, timeout=None):
+        attempts.append(text)
+        if len(attempts) == 1:
+            raise CallTimeoutError("Gemini call timed out after 60.0s")
+        return {"match_score": 70, "matched_skills": []}
+
+    monkeypatch.setattr(resume_routes, "analyze_resume_with_gemini", gemini)
+
+    resume_routes.process_resume_analysis(analysis_id, "Any role", [{"filename": "a.pdf", "content": b""}])
+
+    db = SessionLocal()
+    try:
+        analysis = db.get(ResumeAnalysis, analysis_id)
+    finally:
+        db.close()
+    assert analysis.status == "completed"
+    assert analysis.total_resumes == 1
+    assert analysis.skipped_files is None
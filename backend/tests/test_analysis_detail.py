@@ -0,0 +1,79 @@
+import json
+
+from app.config import COMPLETED_ANALYSIS_MAX_AGE_SECONDS
+from app.routes import resume_routes
+from app.services.result_cache import result_cache
+
+RESULTS = json.dumps([{"name": "Jane Doe", "match_score": 82, "matched_skills": ["python"]}])
+
+
+def test_completed_analysis_has_etag_and_long_cache_control(client, make_analysis):
+    analysis_id = make_analysis(client.user_id, status="completed", total_resumes=1, ranked_results=RESULTS)
+
+    response = client.get(f"/resumes/{analysis_id}")
+
+    assert response.status_code == 200
+    assert response.json()["results"] == json.loads(RESULTS)
+    assert response.headers["ETag"]
+    assert response.headers["Cache-Control"] == f"private, max-age={COMPLETED_ANALYSIS_MAX_AGE_SECONDS}"
+
+
+def test_processing_analysis_is_revalidated(client, make_analysis):
+    analysis_id = make_analysis(client.user_id)
+
+    response = client.get(f"/resumes/{analysis_id}")
+
+    assert response.json()["status"] == "processing"
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert result_cache.get(analysis_id) is None
+
+
+def test_matching_if_none_match_returns_304(client, make_analysis):
+    analysis_id = make_analysis(client.user_id, status="completed", total_resumes=1, ranked_results=RESULTS)
+    etag = client.get(f"/resumes/{analysis_id}").headers["ETag"]
+
+    response = client.get(f"/resumes/{analysis_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    stale = client.get(f"/resumes/{analysis_id}", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+
+
+def test_delete_invalidates_cached_result(client, make_analysis):
+    analysis_id = make_analysis(client.user_id, status="completed", total_resumes=1, ranked_results=RESULTS)
+    client.get(f"/resumes/{analysis_id}")
+    assert result_cache.get(analysis_id) is not None
+
+    assert client.delete(f"/resumes/{analysis_id}").status_code == 200
+
+    assert result_cache.get(analysis_id) is None
+    assert client.get(f"/resumes/{analysis_id}").status_code == 404
+
+
+def test_completion_invalidates_cached_result(client, make_analysis, monkeypatch):
+    analysis_id = make_analysis(client.user_id, status="completed", total_resumes=1, ranked_results=RESULTS)
+    first = client.get(f"/resumes/{analysis_id}")
+
+    # Re-run the analysis: the cached payload must not be served afterwards
+    monkeypatch.setattr(resume_routes, "extract_text_from_file", lambda stream, filename: filename)
+    monkeypatch.setattr(
+        resume_routes,
+        "analyze_resume_with_gemini",
+        lambda text, job_description, timeout=None: {"name": "John Roe", "match_score": 40, "matched_skills": []},
+    )
+    resume_routes.process_resume_analysis(analysis_id, "Any role", [{"filename": "john.pdf", "content": b""}])
+
+    second = client.get(f"/resumes/{analysis_id}", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert [r["name"] for r in second.json()["results"]] == ["John Roe"]
+
+
+def test_other_users_analysis_is_not_found(client, make_analysis):
+    other_id = make_analysis(client.user_id + 10_000, status="completed", ranked_results=RESULTS)
+
+    assert client.get(f"/resumes/{other_id}").status_code == 404
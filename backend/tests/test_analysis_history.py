@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+BASE = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _page_through(client, limit, **params):
+    seen, cursor = [], None
+    while True:
+        query = {"limit": limit, **params}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/resumes/my-analyses", params=query)
+        assert response.status_code == 200
+        seen += [row["analysis_id"] for row in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return seen
+
+
+def test_pages_across_equal_created_at(client, make_analysis):
+    # Three rows share a timestamp, so paging relies on the id tie-break
+    older = make_analysis(client.user_id, created_at=BASE - timedelta(hours=1))
+    same = [make_analysis(client.user_id, created_at=BASE) for _ in range(3)]
+    newer = make_analysis(client.user_id, created_at=BASE + timedelta(hours=1))
+
+    assert _page_through(client, limit=2) == [newer, *reversed(same), older]
+
+
+def test_filters_by_status_and_job_role(client, make_analysis):
+    done = make_analysis(client.user_id, status="completed", job_role="Backend")
+    make_analysis(client.user_id, status="processing", job_role="Backend")
+    make_analysis(client.user_id, status="completed", job_role="Frontend")
+
+    assert _page_through(client, limit=10, status="completed", job_role="Backend") == [done]
+
+
+def test_cursor_survives_deleting_its_row(client, make_analysis):
+    ids = [make_analysis(client.user_id, created_at=BASE + timedelta(minutes=i)) for i in range(4)]
+    first = client.get("/resumes/my-analyses", params={"limit": 2})
+    cursor = first.headers["X-Next-Cursor"]
+
+    assert client.delete(f"/resumes/{first.json()[-1]['analysis_id']}").status_code == 200
+    response = client.get("/resumes/my-analyses", params={"limit": 2, "cursor": cursor})
+
+    assert response.status_code == 200
+    assert [row["analysis_id"] for row in response.json()] == [ids[1], ids[0]]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "NA==", "eA=="])
+def test_invalid_cursor_is_rejected(client, cursor):
+    response = client.get("/resumes/my-analyses", params={"cursor": cursor})
+
+    assert response.status_code == 400
+
+
+def test_history_is_revalidated_with_etag(client, make_analysis):
+    make_analysis(client.user_id)
+    first = client.get("/resumes/my-analyses")
+
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert client.get(
+        "/resumes/my-analyses", headers={"If-None-Match": first.headers["ETag"]}
+    ).status_code == 304
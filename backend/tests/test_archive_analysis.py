@@ -0,0 +1,85 @@
+import io
+import os
+import json
+import zipfile
+
+from docx import Document
+
+from app.database import SessionLocal
+from app.models import ResumeAnalysis
+from app.routes import resume_routes
+
+
+def _docx_bytes(text):
+    document = Document()
+    document.add_paragraph(text)
+    stream = io.BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+def test_unreadable_member_is_skipped(tmp_path, monkeypatch, analysis_id):
+    monkeypatch.setattr(
+        resume_routes,
+        "analyze_resume_with_gemini",
+        lambda text, job_description, timeout=None: {"match_score": 80, "matched_skills": []},
+    )
+    path = tmp_path / "resumes.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("good.docx", _docx_bytes("Jane Doe"))
+        archive.writestr("corrupt.pdf", b"%PDF-1.4 truncated")
+
+    resume_routes.process_archive_analysis(analysis_id, "Python developer", str(path), "zip")
+
+    db = SessionLocal()
+    try:
+        analysis = db.get(ResumeAnalysis, analysis_id)
+        assert analysis.status == "completed"
+        assert [r["file_name"] for r in json.loads(analysis.ranked_results)] == ["good.docx"]
+        skipped = json.loads(analysis.skipped_files)
+        assert [s["file_name"] for s in skipped] == ["corrupt.pdf"]
+        assert skipped[0]["error"]
+    finally:
+        db.close()
+    assert not path.exists()
+
+
+def test_oversized_member_is_skipped_end_to_end(client, monkeypatch):
+    monkeypatch.setattr(
+        resume_routes,
+        "analyze_resume_with_gemini",
+        lambda text, job_description, timeout=None: {"match_score": 70, "matched_skills": []},
+    )
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index in range(3):
+            archive.writestr(f"resume{index}.docx", _docx_bytes(f"Candidate {index}"))
+        archive.writestr("big.pdf", os.urandom(6 * 1024 * 1024))
+
+    response = client.post(
+        "/resumes/analyze-archive",
+        data={"job_description": "Python developer"},
+        files={"archive": ("resumes.zip", stream.getvalue(), "application/zip")},
+    )
+    assert response.status_code == 200
+
+    detail = client.get(f"/resumes/{response.json()['analysis_id']}").json()
+    assert detail["status"] == "completed"
+    assert detail["total_resumes"] == 3
+    assert [s["file_name"] for s in detail["skipped_files"]] == ["big.pdf"]
+    assert "File too large" in detail["skipped_files"][0]["error"]
+
+
+def test_archive_without_resumes_is_rejected_at_upload(client):
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w") as archive:
+        archive.writestr("notes.txt", "notes")
+
+    response = client.post(
+        "/resumes/analyze-archive",
+        data={"job_description": "Python developer"},
+        files={"archive": ("resumes.zip", stream.getvalue(), "application/zip")},
+    )
+
+    assert response.status_code == 400
+    assert "No PDF or DOCX" in response.json()["detail"]
@@ -0,0 +1,162 @@
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from app.services import archive_service
+from app.services.archive_service import iter_archive_resumes, validate_archive
+from app.services.exceptions import ArchiveError
+
+
+def _write_zip(path, members):
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return str(path)
+
+
+def _write_tar(path, members):
+    with tarfile.open(path, "w:gz") as archive:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return str(path)
+
+
+def test_invalid_zip_is_rejected(tmp_path):
+    path = tmp_path / "resumes.zip"
+    path.write_bytes(b"not a zip archive")
+
+    with pytest.raises(ArchiveError, match="Invalid ZIP"):
+        validate_archive(str(path), "zip")
+
+
+def test_invalid_tar_is_rejected(tmp_path):
+    path = tmp_path / "resumes.tar.gz"
+    path.write_bytes(b"not gzip")
+
+    with pytest.raises(ArchiveError, match="Invalid tar.gz"):
+        validate_archive(str(path), "tar")
+
+
+def test_skips_hidden_and_non_resume_members(tmp_path):
+    path = _write_zip(tmp_path / "resumes.zip", {
+        "a.pdf": b"%PDF-1.4 a",
+        "nested/b.docx": b"docx b",
+        "notes.txt": b"notes",
+        ".hidden.pdf": b"hidden",
+        "__MACOSX/._a.pdf": b"metadata",
+    })
+
+    names = [member["filename"] for member in iter_archive_resumes(path, "zip")]
+
+    assert names == ["a.pdf", "nested/b.docx"]
+
+
+def test_archive_without_resumes_is_rejected(tmp_path):
+    path = _write_zip(tmp_path / "resumes.zip", {"notes.txt": b"notes"})
+
+    with pytest.raises(ArchiveError, match="No PDF or DOCX"):
+        list(iter_archive_resumes(path, "zip"))
+
+
+@pytest.mark.parametrize("kind", ["zip", "tar"])
+def test_oversized_member_is_skipped(tmp_path, monkeypatch, kind):
+    monkeypatch.setattr(archive_service, "MAX_UPLOAD_FILE_SIZE_BYTES", 1000)
+    members = {"a.pdf": b"%PDF-1.4 a", "big.pdf": bytes(range(256)) * 8, "b.pdf": b"%PDF-1.4 b"}
+    if kind == "zip":
+        path = _write_zip(tmp_path / "resumes.zip", members)
+    else:
+        path = _write_tar(tmp_path / "resumes.tar.gz", members)
+
+    members = list(iter_archive_resumes(path, kind))
+
+    assert [m["filename"] for m in members] == ["a.pdf", "big.pdf", "b.pdf"]
+    assert members[1]["content"] is None
+    assert "File too large" in members[1]["error"]
+    assert members[2]["content"] == b"%PDF-1.4 b"
+
+
+def test_zip_member_with_suspicious_ratio_is_skipped(tmp_path, monkeypatch):
+    # Keep the archive-wide ratio in bounds so only the member check applies
+    path = _write_zip(tmp_path / "resumes.zip", {
+        "a.pdf": os.urandom(64 * 1024),
+        "bomb.pdf": bytes(1024 * 1024),
+    })
+
+    members = list(iter_archive_resumes(path, "zip"))
+
+    assert members[1]["filename"] == "bomb.pdf"
+    assert "compression ratio" in members[1]["error"]
+
+
+def test_encrypted_zip_member_is_skipped(tmp_path):
+    path = _write_zip(tmp_path / "resumes.zip", {"a.pdf": b"%PDF-1.4 a", "locked.pdf": b"%PDF-1.4 b"})
+    # Set the "encrypted" flag of the last member in the central directory
+    with open(path, "rb") as fh:
+        data = bytearray(fh.read())
+    data[data.rfind(b"PK\x01\x02") + 8] |= 0x1
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+    members = list(iter_archive_resumes(path, "zip"))
+
+    assert members[0]["content"] == b"%PDF-1.4 a"
+    assert members[1]["content"] is None
+    assert "Could not extract locked.pdf" in members[1]["error"]
+
+
+def test_zip_without_resumes_is_rejected_at_upload(tmp_path):
+    path = _write_zip(tmp_path / "resumes.zip", {"notes.txt": b"notes", "__MACOSX/._a.pdf": b"x"})
+
+    with pytest.raises(ArchiveError, match="No PDF or DOCX"):
+        validate_archive(path, "zip")
+
+
+def test_zip_declared_sizes_are_checked_at_upload(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_service, "MAX_ARCHIVE_UNCOMPRESSED_BYTES", 1000)
+    path = _write_zip(tmp_path / "resumes.zip", {"a.pdf": os.urandom(600), "b.pdf": os.urandom(600)})
+
+    with pytest.raises(ArchiveError, match="uncompressed size"):
+        validate_archive(path, "zip")
+
+
+def test_zip_bomb_is_rejected_at_upload(tmp_path):
+    path = _write_zip(tmp_path / "resumes.zip", {"bomb.pdf": bytes(1024 * 1024)})
+
+    with pytest.raises(ArchiveError, match="compression ratio"):
+        validate_archive(path, "zip")
+
+
+def test_valid_zip_passes_upload_checks(tmp_path):
+    path = _write_zip(tmp_path / "resumes.zip", {"a.pdf": b"%PDF-1.4 a", "notes.txt": b"x"})
+
+    validate_archive(path, "zip")
+
+
+def test_tar_skipped_members_count_towards_limits(tmp_path):
+    # The zero-filled .txt is never yielded but is still decompressed
+    path = _write_tar(tmp_path / "resumes.tar.gz", {
+        "padding.txt": bytes(4 * 1024 * 1024),
+        "a.pdf": b"%PDF-1.4 a",
+    })
+
+    with pytest.raises(ArchiveError, match="compression ratio"):
+        list(iter_archive_resumes(path, "tar"))
+
+
+@pytest.mark.parametrize("kind", ["zip", "tar"])
+def test_entry_count_includes_skipped_members(tmp_path, monkeypatch, kind):
+    monkeypatch.setattr(archive_service, "MAX_ARCHIVE_ENTRIES", 3)
+    members = {f"note{i}.txt": b"x" for i in range(5)}
+    members["a.pdf"] = b"%PDF-1.4 a"
+    if kind == "zip":
+        path = _write_zip(tmp_path / "resumes.zip", members)
+    else:
+        path = _write_tar(tmp_path / "resumes.tar.gz", members)
+
+    with pytest.raises(ArchiveError, match="more than 3 entries"):
+        list(iter_archive_resumes(path, kind))
@@ -0,0 +1,60 @@
+import json
+import os
+
+import pytest
+
+from app.services.contact_extractor import CONTACT_FIELDS, extract_contact_fields
+
+CORPUS_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "benchmarks", "fixtures", "contact_corpus.json"
+)
+
+
+def _normalize(field, value):
+    if not value:
+        return None
+    if field == "contact_number":
+        return "".join(ch for ch in value if ch.isdigit() or ch == "+")
+    return " ".join(value.split()).lower()
+
+
+@pytest.mark.parametrize("text, field", [
+    ("Experience\n  06/2018 - 09/2021 Software Engineer", "contact_number"),
+    ("Aadhaar 1234 5678 9012", "contact_number"),
+    ("Education\n(2012 - 2016) B.E.\nWork 2016-2021", "contact_number"),
+    ("Data Scientist\nBuilt ML pipelines.", "name"),
+    ("New Delhi\nAarav Sharma", "name"),
+    ("Product Owner\nkaran.mehta@gmail.com", "name"),
+    ("Machine Learning\nneha.gupta@yahoo.com | 9876543210", "name"),
+    ("Team Player\nteam.lead@example.com", "name"),
+    ("Aditya Rao\n" + "Built billing services.\n" * 8 + "CTC 1200000000", "contact_number"),
+    ("Meera Pillai\n" + "Built billing services.\n" * 8 + "Patent US 123 456 7890", "contact_number"),
+])
+def test_ambiguous_values_are_left_to_the_llm(text, field):
+    assert extract_contact_fields(text)[field] is None
+
+
+def test_name_matching_email_is_found():
+    found = extract_contact_fields("RAHUL VERMA\nrahul.verma92@yahoo.co.in | 9876543210")
+
+    assert found["name"] == "Rahul Verma"
+    assert found["contact_number"] == "9876543210"
+
+
+def test_labelled_phone_is_found_anywhere():
+    text = "Aditya Rao\n" + "Built billing services.\n" * 8 + "Mobile: 98450 12345"
+
+    assert extract_contact_fields(text)["contact_number"] == "98450 12345"
+
+
+def test_corpus_has_no_wrong_values():
+    # A found value overrides Gemini, so it must be right; None is allowed
+    with open(CORPUS_PATH) as fh:
+        corpus = json.load(fh)
+
+    for case in corpus:
+        found = extract_contact_fields(case["text"])
+        for field in CONTACT_FIELDS:
+            value = _normalize(field, found[field])
+            if value is not None:
+                assert value == _normalize(field, case["expected"][field]), (case["text"], field)
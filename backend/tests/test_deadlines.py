@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.deadlines import (
+    Deadline,
+    HedgeBudget,
+    LatencyTracker,
+    async_call_with_deadline,
+    call_with_deadline,
+)
+from app.services.exceptions import AnalysisTimeoutError, CallTimeoutError
+
+
+class ScriptedCalls:
+    """
+    fn(timeout) whose n-th attempt sleeps / fails as scripted: [(seconds, result_or_exception)]
+    """
+
+    def __init__(self, script):
+        self.script = script
+        self.attempts = 0
+        self._lock = threading.Lock()
+
+    def _next(self):
+        with self._lock:
+            step = self.script[self.attempts]
+            self.attempts += 1
+        return step
+
+    def __call__(self, timeout):
+        seconds, outcome = self._next()
+        time.sleep(seconds)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def call_async(self, timeout):
+        seconds, outcome = self._next()
+        await asyncio.sleep(seconds)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_hedge_wins_when_primary_is_slow():
+    calls = ScriptedCalls([(1.0, "primary"), (0.0, "hedge")])
+    budget = HedgeBudget(1.0)
+
+    started = time.monotonic()
+    result = call_with_deadline(calls, 2, hedge_delay=0.05, hedge_budget=budget)
+
+    assert result == "hedge"
+    assert calls.attempts == 2
+    assert budget.hedges == 1
+    assert time.monotonic() - started < 0.5
+
+
+def test_primary_error_waits_for_pending_hedge():
+    calls = ScriptedCalls([(0.1, RuntimeError("primary failed")), (0.2, "hedge")])
+
+    assert call_with_deadline(calls, 2, hedge_delay=0.05, hedge_budget=HedgeBudget(1.0)) == "hedge"
+
+
+def test_all_attempts_failing_raises_last_error():
+    calls = ScriptedCalls([(0.1, RuntimeError("primary")), (0.0, ValueError("hedge"))])
+
+    with pytest.raises((RuntimeError, ValueError)):
+        call_with_deadline(calls, 2, hedge_delay=0.05, hedge_budget=HedgeBudget(1.0))
+
+
+def test_budget_refuses_hedge():
+    calls = ScriptedCalls([(0.2, "primary"), (0.0, "hedge")])
+    budget = HedgeBudget(0.0)
+
+    assert call_with_deadline(calls, 2, hedge_delay=0.05, hedge_budget=budget) == "primary"
+    assert calls.attempts == 1
+    assert (budget.calls, budget.hedges) == (1, 0)
+
+
+def test_success_records_latency():
+    tracker = LatencyTracker()
+
+    call_with_deadline(ScriptedCalls([(0.05, "ok")]), 2, tracker=tracker)
+
+    assert tracker.count() == 1
+    assert 0.05 <= tracker.percentile(50) < 0.5
+
+
+def test_timeout_records_the_timeout_as_sample():
+    tracker = LatencyTracker()
+
+    with pytest.raises(CallTimeoutError):
+        call_with_deadline(ScriptedCalls([(0.5, "late")]), 0.1, tracker=tracker)
+
+    assert tracker.count() == 1
+    assert tracker.percentile(50) == 0.1
+
+
+def test_deadline_caps_call_timeout_and_expires():
+    deadline = Deadline(0.05)
+
+    assert deadline.call_timeout(60) <= 0.05
+    time.sleep(0.06)
+    with pytest.raises(AnalysisTimeoutError) as info:
+        deadline.call_timeout(60)
+    assert not isinstance(info.value, CallTimeoutError)
+
+
+def test_async_hedge_wins_and_loser_is_cancelled():
+    cancelled = asyncio.Event()
+
+    async def scenario():
+        attempts = 0
+
+        async def fn(timeout):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return "primary"
+            return "hedge"
+
+        result = await async_call_with_deadline(fn, 2, hedge_delay=0.05, hedge_budget=HedgeBudget(1.0))
+        await asyncio.wait_for(cancelled.wait(), 1)
+        return result
+
+    assert asyncio.run(scenario()) == "hedge"
+    assert cancelled.is_set()
+
+
+def test_async_timeout_cancels_and_records():
+    tracker = LatencyTracker()
+    calls = ScriptedCalls([(5, "late")])
+
+    async def scenario():
+        task_count = len(asyncio.all_tasks())
+        with pytest.raises(CallTimeoutError):
+            await async_call_with_deadline(calls.call_async, 0.1, tracker=tracker)
+        await asyncio.sleep(0)
+        return len(asyncio.all_tasks()) - task_count
+
+    assert asyncio.run(scenario()) == 0
+    assert tracker.percentile(50) == 0.1
+
+
+def test_async_primary_error_waits_for_hedge():
+    calls = ScriptedCalls([(0.1, RuntimeError("primary failed")), (0.2, "hedge")])
+
+    result = asyncio.run(
+        async_call_with_deadline(calls.call_async, 2, hedge_delay=0.05, hedge_budget=HedgeBudget(1.0))
+    )
+
+    assert result == "hedge"
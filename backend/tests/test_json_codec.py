@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from app.services.json_codec import available_codecs
+
+CODECS = available_codecs()
+
+PAYLOADS = [
+    {"analysis_id": 1, "results": [{"name": "Jane", "match_score": 82.5}]},
+    {1: "int key", 2.5: "float key"},
+    {None: "null key", True: "bool key"},
+    {"big": 2 ** 70},
+    {"text": "Résumé – naïve"},
+]
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_codecs_encode_what_stdlib_encodes(name, payload):
+    expected = json.loads(json.dumps(payload))
+
+    encoded = CODECS[name].dumps(payload)
+
+    assert json.loads(encoded) == expected
+    assert CODECS[name].loads(encoded) == expected
+
+
+def test_fast_json_response_accepts_int_keys():
+    from app.services.json_codec import FastJSONResponse
+
+    response = FastJSONResponse({1: "a"})
+
+    assert json.loads(response.body) == {"1": "a"}
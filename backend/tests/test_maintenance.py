@@ -0,0 +1,126 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, inspect, text, update
+
+from app import maintenance
+from app.bootstrap import create_schema
+from app.database import Base, SessionLocal
+from app.db_types import is_compressed
+from app.models import JobDescription, ResumeAnalysis
+from app.services.storage_service import get_or_create_job_description
+
+
+def _raw_value(db, analysis_id):
+    column = maintenance._raw(ResumeAnalysis, "ranked_results")
+    return db.query(column).filter(ResumeAnalysis.id == analysis_id).scalar()
+
+
+def _set_raw(db, analysis_id, value):
+    # Written through the raw column, as legacy rows were
+    db.execute(
+        update(ResumeAnalysis)
+        .where(ResumeAnalysis.id == analysis_id)
+        .values({maintenance._raw(ResumeAnalysis, "ranked_results"): value})
+    )
+    db.commit()
+
+
+def test_compact_skips_values_that_stay_plain(analysis_id):
+    db = SessionLocal()
+    try:
+        _set_raw(db, analysis_id, "[]")
+
+        maintenance._recompress(db, ResumeAnalysis, "ranked_results", 100, 0)
+        second = maintenance._recompress(db, ResumeAnalysis, "ranked_results", 100, 0)
+
+        # Nothing left to compact, so the short value is not rewritten again
+        assert second["rows"] == 0
+        assert _raw_value(db, analysis_id) == "[]"
+    finally:
+        db.close()
+
+
+def test_compact_compresses_large_legacy_values(analysis_id):
+    db = SessionLocal()
+    try:
+        _set_raw(db, analysis_id, '[{"name": "Jane Doe", "matched_skills": ["python"]}]' * 50)
+
+        result = maintenance._recompress(db, ResumeAnalysis, "ranked_results", 100, 0)
+
+        assert result["rows"] >= 1
+        assert result["bytes_after"] < result["bytes_before"]
+        assert is_compressed(_raw_value(db, analysis_id))
+    finally:
+        db.close()
+
+
+def test_prune_keeps_recent_unreferenced_job_descriptions():
+    create_schema()
+    db = SessionLocal()
+    try:
+        recent = get_or_create_job_description(db, "Recent role")
+        db.commit()
+        old_id = db.execute(
+            insert(JobDescription).values(
+                content_hash="0" * 64,
+                text="Old role",
+                created_at=datetime.utcnow() - timedelta(days=30),
+            )
+        ).inserted_primary_key[0]
+        db.commit()
+        recent_id = recent.id
+    finally:
+        db.close()
+
+    maintenance.prune(older_than_days=7, batch_size=100, pause=0)
+
+    db = SessionLocal()
+    try:
+        assert db.get(JobDescription, recent_id) is not None
+        assert db.get(JobDescription, old_id) is None
+    finally:
+        db.close()
+
+
+def test_prune_archives_skipped_files(tmp_path, client, make_analysis):
+    skipped = [{"file_name": "broken.pdf", "error": "Could not read file"}]
+    analysis_id = make_analysis(
+        client.user_id,
+        status="completed",
+        skipped_files=json.dumps(skipped),
+        created_at=datetime.utcnow() - timedelta(days=30),
+    )
+
+    report = maintenance.prune(older_than_days=7, batch_size=100, pause=0, archive_dir=str(tmp_path))
+
+    with gzip.open(report["archive"], "rt", encoding="utf-8") as fh:
+        rows = {row["id"]: row for row in map(json.loads, fh)}
+    assert rows[analysis_id]["skipped_files"] == skipped
+
+
+def test_create_schema_adds_missing_foreign_key_columns(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    tables = [table for table in Base.metadata.sorted_tables if table.name != "resume_analyses"]
+    Base.metadata.create_all(bind=engine, tables=tables)
+    with engine.begin() as conn:
+        # resume_analyses as it was before job descriptions were split out
+        conn.execute(text(
+            "CREATE TABLE resume_analyses ("
+            "id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users (id), "
+            "job_role VARCHAR, job_description TEXT, total_resumes INTEGER, "
+            "status VARCHAR, ranked_results TEXT, created_at DATETIME)"
+        ))
+
+    create_schema(bind=engine)
+
+    inspector = inspect(engine)
+    columns = {column["name"] for column in inspector.get_columns("resume_analyses")}
+    assert {"job_description_id", "skipped_files"} <= columns
+    foreign_keys = {
+        (tuple(fk["constrained_columns"]), fk["referred_table"])
+        for fk in inspector.get_foreign_keys("resume_analyses")
+    }
+    assert (("job_description_id",), "job_descriptions") in foreign_keys
+    engine.dispose()